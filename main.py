@@ -34,11 +34,80 @@ Quality flags:
     -qk : 4K quality (2160p60)
 """
 
-from manim import *
 import argparse
+import json
+import os
 import sys
 
-# Import all scenes
+from scenes.registry import discover_scenes, load_scene, scene_description, video_scenes
+
+
+# Scene order, pauses and quality of each composition (shared with render_scenes.py)
+MANIFEST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compositions.json")
+
+
+def load_compositions():
+    """Compositions from compositions.json, by name"""
+    with open(MANIFEST_FILE, encoding="utf-8") as f:
+        return json.load(f)["compositions"]
+
+
+def cli():
+    """
+    Command-line interface for quick access
+    
+    Only reads the scene registry and the manifest, so it answers
+    immediately without importing manim, PIL or any scene.
+    
+    Examples:
+        python main.py                    # Show help
+        python main.py --list             # List available scenes
+        python main.py --render-all       # Render all scenes individually
+    """
+    
+    if len(sys.argv) > 1:
+        if "--list" in sys.argv:
+            print("\nAvailable scenes:")
+            for i, name in enumerate(video_scenes(), 1):
+                print(f"{i}. {name} - {scene_description(name)}")
+            
+            extra_scenes = [name for name in discover_scenes() if name not in video_scenes()]
+            if extra_scenes:
+                print("\nOther scenes:")
+                for name in extra_scenes:
+                    print(f"- {name} - {scene_description(name)}")
+            
+            print("\nCompositions:")
+            for name, spec in load_compositions().items():
+                print(f"- {name} - {spec.get('description', '')}")
+            print("\nUsage:")
+            print("  manim main.py [SceneName]")
+            print("  manim -qh main.py CASVideoComposition")
+            print("  python render_scenes.py [scene_number] [quality]")
+        
+        elif "--render-all" in sys.argv:
+            print("To render all scenes, use:")
+            print("  python render_scenes.py all [quality]")
+            print("\nExample:")
+            print("  python render_scenes.py all h    # High quality")
+            print("\nTo build the compositions from the rendered scenes:")
+            print("  python render_scenes.py compose h")
+        
+        else:
+            print(__doc__)
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    cli()
+    sys.exit()
+
+
+# Everything below is only needed when manim loads this file to render a scene
+from manim import *
+
+# Import all scenes (the scenes package loads each module on first access)
 from scenes import (
     CreativeParadox,
     ConceptReframing,
@@ -50,6 +119,26 @@ from scenes import (
 )
 
 
+def play_composition(scene, name):
+    """Play the scenes of a composition from compositions.json, in order"""
+    entries = load_compositions()[name]["scenes"]
+    
+    for i, entry in enumerate(entries):
+        try:
+            scene_class = load_scene(entry["scene"])
+        except KeyError:
+            raise KeyError(
+                f"Unknown scene '{entry['scene']}' in composition '{name}'. "
+                f"Valid scenes: {', '.join(discover_scenes())}"
+            ) from None
+        child = scene_class()
+        child.construct()
+        if entry.get("hold", 0) > 0:
+            scene.wait(entry["hold"])
+        if i < len(entries) - 1:
+            scene.clear()
+
+
 # ============================================================================
 # MAIN COMPOSITION SCENE
 # ============================================================================
@@ -57,39 +146,7 @@ class CASVideoComposition(Scene):
     """Combines all five scenes into one continuous video"""
     
     def construct(self):
-        # Scene 1: Creative Paradox
-        # Shows the fundamental tension between originality and coherence
-        scene1 = CreativeParadox()
-        scene1.construct()
-        self.wait(0.5)
-        self.clear()
-        
-        # Scene 2: Concept Reframing
-        # Reframes art as conceptual combinations rather than visual objects
-        scene2 = ConceptReframing()
-        scene2.construct()
-        self.wait(0.5)
-        self.clear()
-        
-        # Scene 3: LLM Problem
-        # Demonstrates how LLMs fall into cultural gravity wells
-        scene3 = LLMProblem()
-        scene3.construct()
-        self.wait(0.5)
-        self.clear()
-        
-        # Scene 4: Introducing CAS Solution
-        # Explains the Cultural Alien Sampler approach
-        scene4 = IntroducingCASSolution()
-        scene4.construct()
-        self.wait(0.5)
-        self.clear()
-        
-        # Scene 5: Evolutionary Tree (NEW!)
-        # Visualizes the evolutionary exploration through embedding space
-        scene5 = EvolutionaryTree()
-        scene5.construct()
-        self.wait(1)
+        play_composition(self, "CASVideoComposition")
 
 
 # ============================================================================
@@ -99,22 +156,7 @@ class CASVideoShort(Scene):
     """Shortened version focusing on key points (recommended for talks)"""
     
     def construct(self):
-        # Problem
-        scene3 = LLMProblem()
-        scene3.construct()
-        self.wait(0.3)
-        self.clear()
-        
-        # Solution
-        scene4 = IntroducingCASSolution()
-        scene4.construct()
-        self.wait(0.3)
-        self.clear()
-        
-        # Results
-        scene5 = EvolutionaryTree()
-        scene5.construct()
-        self.wait(0.5)
+        play_composition(self, "CASVideoShort")
 
 
 # ============================================================================
@@ -124,52 +166,4 @@ class CASVideoDemo(Scene):
     """Demo version focusing on the evolutionary process"""
     
     def construct(self):
-        # Quick setup
-        scene2 = ConceptReframing()
-        scene2.construct()
-        self.wait(0.3)
-        self.clear()
-        
-        # The magic
-        scene5 = EvolutionaryTree()
-        scene5.construct()
-        self.wait(1)
-
-
-if __name__ == "__main__":
-    """
-    Command-line interface for quick access
-    
-    Examples:
-        python main.py                    # Show help
-        python main.py --list             # List available scenes
-        python main.py --render-all       # Render all scenes individually
-    """
-    
-    if len(sys.argv) > 1:
-        if "--list" in sys.argv:
-            print("\nAvailable scenes:")
-            print("1. CreativeParadox - The creative tension")
-            print("2. ConceptReframing - Art as concepts")
-            print("3. LLMProblem - Cultural anchoring problem")
-            print("4. IntroducingCASSolution - CAS method explanation")
-            print("5. EvolutionaryTree - Evolutionary visualization (NEW!)")
-            print("\nCompositions:")
-            print("- CASVideoComposition - All scenes (full version)")
-            print("- CASVideoShort - Key scenes (presentation version)")
-            print("- CASVideoDemo - Demo version (quick overview)")
-            print("\nUsage:")
-            print("  manim main.py [SceneName]")
-            print("  manim -qh main.py CASVideoComposition")
-            print("  python render_scenes.py [scene_number] [quality]")
-        
-        elif "--render-all" in sys.argv:
-            print("To render all scenes, use:")
-            print("  python render_scenes.py all [quality]")
-            print("\nExample:")
-            print("  python render_scenes.py all h    # High quality")
-        
-        else:
-            print(__doc__)
-    else:
-        print(__doc__)
\ No newline at end of file
+        play_composition(self, "CASVideoDemo")
@@ -6,112 +6,740 @@ Usage:
     python render_scenes.py [scene_number] [quality]
     
     If no scene_number is provided, all scenes will be rendered.
-    Scene numbers: 1 = CreativeParadox, 2 = ConceptReframing, 
-                   3 = LLMProblem, 4 = IntroducingCASSolution
+    Scenes are numbered in video order (see `python main.py --list`);
+    scenes outside the video, such as CAMShowcaseGrid, can be given by name.
     
     Quality options: l=low (480p15), m=medium (720p30), h=high (1080p60), k=4K (2160p60)
 
 Examples:
     python render_scenes.py              # Render all scenes (low quality)
-    python render_scenes.py 1            # Render only CreativeParadox (low quality)
-    python render_scenes.py 3 h          # Render only LLMProblem (high quality)
+    python render_scenes.py 1            # Render only GeneralProblem (low quality)
+    python render_scenes.py 4 h          # Render only LLMProblem (high quality)
+    python render_scenes.py CAMShowcaseGrid m    # Render a scene by name
     python render_scenes.py all m        # Render all scenes (medium quality)
+    python render_scenes.py all h --jobs 4   # Render all scenes, 4 at a time
+    python render_scenes.py all h --force    # Re-render even if the cache is up to date
+    python render_scenes.py report           # Summarise render telemetry across runs
+    python render_scenes.py report h         # ... for high quality renders only
+    python render_scenes.py 3 h --split 4    # Render one scene as 4 animation ranges in parallel
+    python render_scenes.py all l --batch    # Render all scenes in this process, importing manim once
+    python render_scenes.py watch            # Re-render scenes affected by each edit (low quality)
+    python render_scenes.py compose          # Build the videos in compositions.json from the per-scene outputs
+    python render_scenes.py compose l        # ... with every composition at low quality
+    python render_scenes.py warm-cache       # Compile the scenes' Text and TeX in a process pool
 """
 
-import sys
-import subprocess
+import argparse
+import ast
+import hashlib
+import heapq
+import json
 import os
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from scenes.registry import discover_scenes, load_scene, video_scenes
 
-# Define all scene classes with their file paths
+# Package holding the scene modules and their shared helpers
+SCENES_PACKAGE = "scenes"
+
+# All scene classes with their file paths, found without importing them
 SCENES = {
-    "GeneralProblem": "scenes/general_problem.py",
-    "CreativeParadox": "scenes/creative_paradox.py",
-    "ConceptReframing": "scenes/concept_reframing.py",
-    "LLMProblem": "scenes/llm_problem.py",
-    "OpenEndedAgent": "scenes/open_ended_agent.py",
-    "IntroducingCASSolution": "scenes/introducing_cas_solution.py",
-    "EvolutionaryTree": "scenes/evolutionary_tree.py",
-    "CAMShowcase": "scenes/cam_examples.py",
-    "ExperimentalResults": "scenes/experimental_results.py"
+    name: f"{SCENES_PACKAGE}/{module}.py"
+    for name, module in discover_scenes().items()
+}
+
+# Scenes of the video in playback order, for indexing
+SCENE_LIST = video_scenes()
+
+# Files and folders each scene reads while rendering (folders are scanned recursively)
+SCENE_ASSETS = {
+    "ConceptReframing": ["river-st-urbain-1930.jpg!Large.jpg"],
+    "EvolutionaryTree": ["romanticism-landscape.gif"],
+    "CAMShowcase": ["images"],
+    "CAMShowcaseGrid": ["images"]
+}
+
+# Files that affect every scene. Shared scene modules such as scenes/helpers.py
+# are picked up from each scene's imports instead.
+SHARED_FILES = ["manim.cfg"]
+
+# Files and folders watched by `render_scenes.py watch`, besides the scene assets
+WATCH_PATHS = ["scenes", "main.py", "manim.cfg"]
+
+# Output folder manim uses for each quality flag
+QUALITY_DIRS = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60"
 }
 
-# Scene list for indexing
-SCENE_LIST = list(SCENES.keys())
+# manim config name for each quality flag
+QUALITY_NAMES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality"
+}
+
+MEDIA_DIR = "media"
+
+# Fingerprints, durations and frame counts of the last successful render of each scene and quality
+CACHE_FILE = os.path.join(MEDIA_DIR, "render_cache.json")
+
+# One JSON record per render attempt, appended across runs
+TELEMETRY_FILE = os.path.join(MEDIA_DIR, "render_log.jsonl")
+
+# Working folder for scenes rendered as several animation ranges
+SPLIT_DIR = os.path.join(MEDIA_DIR, "split")
+
+# Scene order, pauses and quality of the full-length videos (shared with main.py)
+MANIFEST_FILE = "compositions.json"
+
+COMPOSITION_DIR = os.path.join(MEDIA_DIR, "videos", "compositions")
+
+# Mobjects compiled ahead of rendering by `render_scenes.py warm-cache`
+WARM_CALLS = ("cached_text", "cached_markup_text", "MathTex", "Tex")
 
+# Argument expressions warm-cache evaluates: literals, names and operators, no calls
+_WARM_NODES = (
+    ast.expr_context, ast.keyword, ast.Constant, ast.Name, ast.Attribute,
+    ast.UnaryOp, ast.unaryop, ast.BinOp, ast.operator, ast.Tuple, ast.List, ast.Dict
+)
 
-def render_scene(scene_name, quality="l"):
+# Counts the play() calls of a scene without rendering any frames
+_COUNT_PLAYS = """
+import importlib.util, os, sys
+path, name = sys.argv[1], sys.argv[2]
+sys.path[:0] = [os.path.dirname(os.path.abspath(path)), os.getcwd()]
+from manim import tempconfig
+spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
+with tempconfig({"dry_run": True, "quality": "low_quality", "preview": False}):
+    scene = getattr(module, name)(skip_animations=True)
+    scene.render()
+    print("NUM_PLAYS", scene.renderer.num_plays)
+"""
+
+
+# Output from parallel render jobs goes through this lock so lines stay whole
+_print_lock = threading.Lock()
+
+
+def _log(*args):
+    """Print a message without interleaving it with other render jobs"""
+    with _print_lock:
+        print(*args, flush=True)
+
+
+def scene_output_path(scene_name, quality):
+    """Path of the movie file manim writes for a scene at a given quality"""
+    module_name = os.path.splitext(os.path.basename(SCENES[scene_name]))[0]
+    return os.path.join(
+        MEDIA_DIR, "videos", module_name, QUALITY_DIRS[quality], f"{scene_name}.mp4"
+    )
+
+
+def _local_imports(module_path):
+    """Modules of the scenes package imported by a module file"""
+    try:
+        with open(module_path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), module_path)
+    except (OSError, SyntaxError):
+        return []
+    
+    package_dir = SCENES_PACKAGE
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            if node.level == 1 and node.module:            # from .helpers import x
+                names.append(node.module)
+            elif node.level == 1 or node.module == package_dir:  # from . import helpers
+                names.extend(alias.name for alias in node.names)
+            elif node.module and node.module.startswith(package_dir + "."):
+                names.append(node.module[len(package_dir) + 1:])  # from scenes.helpers import x
+        elif isinstance(node, ast.Import):
+            names.extend(
+                alias.name[len(package_dir) + 1:] for alias in node.names
+                if alias.name.startswith(package_dir + ".")
+            )
+    
+    paths = [f"{package_dir}/{name.split('.')[0]}.py" for name in names]
+    return [path for path in paths if os.path.exists(path)]
+
+
+def scene_modules(scene_name):
+    """A scene's module file and the package modules it imports (transitively)"""
+    modules = [SCENES[scene_name]]
+    for module in modules:
+        for imported in _local_imports(module):
+            if imported not in modules:
+                modules.append(imported)
+    return modules
+
+
+def scene_dependencies(scene_name):
     """
-    Render a specific scene from its module file
+    List every file whose content affects the rendered output of a scene:
+    its module, the scene modules it imports (transitively), the shared
+    files and its assets
+    """
+    paths = scene_modules(scene_name) + SHARED_FILES
+    
+    for asset in SCENE_ASSETS.get(scene_name, []):
+        if os.path.isdir(asset):
+            for root, dirs, files in os.walk(asset):
+                dirs.sort()
+                paths.extend(os.path.join(root, name) for name in sorted(files))
+        else:
+            paths.append(asset)
+    
+    return paths
+
+
+_cache_lock = threading.Lock()
+_cache = None
+
+# Set when a file digest was computed since the cache was last saved
+_digests_changed = False
+
+
+def _load_cache():
+    """Load the render cache from disk (once per run)"""
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_FILE, encoding="utf-8") as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+        _cache.setdefault("renders", {})
+        _cache.setdefault("files", {})
+        _cache.setdefault("durations", {})
+        _cache.setdefault("frames", {})
+        _cache.setdefault("compositions", {})
+    return _cache
+
+
+def _save_cache():
+    global _digests_changed
+    _digests_changed = False
+    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+    tmp_path = CACHE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, CACHE_FILE)
+
+
+def _file_digest(path):
+    """
+    Hash a file's content, reusing the stored digest while its size and
+    modification time are unchanged so large assets are not re-read every run
+    """
+    global _digests_changed
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    
+    files = _load_cache()["files"]
+    entry = files.get(path)
+    if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry["sha256"]
+    
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    
+    files[path] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest.hexdigest()
+    }
+    _digests_changed = True
+    return digest.hexdigest()
+
+
+def scene_fingerprint(scene_name, quality):
+    """
+    Hash everything that determines a scene's output: its module, the shared
+    helpers, manim.cfg, the quality flag and the assets it reads
+    """
+    fingerprint = hashlib.sha256(f"quality={quality}\n".encode())
+    with _cache_lock:
+        for path in scene_dependencies(scene_name):
+            fingerprint.update(f"{path}={_file_digest(path)}\n".encode())
+        if _digests_changed:
+            # Keep new digests even if nothing is rendered, so the next
+            # fully cached run does not hash the assets again
+            _save_cache()
+    return fingerprint.hexdigest()
+
+
+def is_cached(scene_name, quality, fingerprint):
+    """Check whether the existing output was rendered from identical inputs"""
+    with _cache_lock:
+        cached = _load_cache()["renders"].get(f"{scene_name}:{quality}")
+    return (
+        cached == fingerprint
+        and os.path.exists(scene_output_path(scene_name, quality))
+    )
+
+
+def record_render(scene_name, quality, fingerprint, duration=None):
+    """
+    Remember the inputs and wall time (in seconds) of a successful render
+    
+    Without a duration (a split render, whose wall time is not that of a
+    single-process render) only the fingerprint is recorded, so the
+    scheduling estimates of schedule_scenes stay comparable. The output's
+    frame count is probed here, once per render, for the telemetry of
+    later cache hits.
+    """
+    frames = _count_frames(scene_output_path(scene_name, quality))
+    with _cache_lock:
+        cache = _load_cache()
+        cache["renders"][f"{scene_name}:{quality}"] = fingerprint
+        cache["frames"][f"{scene_name}:{quality}"] = frames
+        if duration is not None:
+            cache["durations"][f"{scene_name}:{quality}"] = round(duration, 2)
+        _save_cache()
+
+
+def schedule_scenes(scenes, quality, jobs, force=False):
+    """
+    Order scenes longest first using the durations of earlier renders
+    
+    Scenes that are already cached cost nothing. Scenes without history are
+    assumed to be as slow as the slowest known scene, so they start early
+    instead of extending the tail of the run.
+    
+    Returns:
+        (ordered scene names, predicted makespan in seconds or None when
+         nothing has been timed yet, scenes without history)
+    """
+    with _cache_lock:
+        durations = dict(_load_cache()["durations"])
+    
+    known = [durations[f"{scene}:{quality}"] for scene in scenes
+             if f"{scene}:{quality}" in durations]
+    fallback = max(known, default=0.0)
+    
+    estimates = {}
+    unknown = []
+    for scene in scenes:
+        if not force and is_cached(scene, quality, scene_fingerprint(scene, quality)):
+            estimates[scene] = 0.0
+        elif f"{scene}:{quality}" in durations:
+            estimates[scene] = durations[f"{scene}:{quality}"]
+        else:
+            estimates[scene] = fallback
+            unknown.append(scene)
+    
+    # Stable sort keeps playback order among scenes with equal estimates
+    ordered = sorted(scenes, key=lambda scene: -estimates[scene])
+    
+    # Simulate the pool: each job starts on whichever worker frees up first
+    workers = [0.0] * max(1, jobs)
+    for scene in ordered:
+        heapq.heappush(workers, heapq.heappop(workers) + estimates[scene])
+    
+    if unknown and not known:
+        return ordered, None, unknown
+    return ordered, max(workers), unknown
+
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def _venv_python():
+    """Path of the project's virtual environment Python, or None"""
+    venv_python = os.path.join(os.path.dirname(__file__), ".venv", "Scripts", "python.exe")
+    return venv_python if os.path.exists(venv_python) else None
+
+
+def _subprocess_env():
+    """
+    Environment for render processes
+
+    manim puts the scene file's own directory on sys.path, so the project
+    root is added to let scene modules import shared code from the package.
+    """
+    env = os.environ.copy()
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [project_dir, env.get("PYTHONPATH")])
+    )
+    return env
+
+
+def manim_command(scene_name, quality, extra_args=()):
+    """
+    Build the manim command line for a scene
     
     Args:
         scene_name: Name of the scene class to render
         quality: Render quality (l=low, m=medium, h=high, k=4k)
+        extra_args: Additional manim options, placed before the scene file
     """
-    print(f"\n{'='*60}")
-    print(f"Rendering scene: {scene_name}")
-    print(f"{'='*60}\n")
-    
-    # Get the scene file path
-    scene_file = SCENES.get(scene_name)
-    if not scene_file:
-        print(f"Error: Scene '{scene_name}' not found")
-        return False
+    scene_file = SCENES[scene_name]
     
     # Check if we're in a virtual environment
-    venv_python = os.path.join(os.path.dirname(__file__), ".venv", "Scripts", "python.exe")
+    venv_python = _venv_python()
     
-    if os.path.exists(venv_python):
+    if venv_python:
         # Use virtual environment Python with manim module
-        cmd = [
+        return [
             venv_python,
             "-m", "manim",
             "-q" + quality,  # Quality flag (e.g., -ql, -qh)
+            *extra_args,
             scene_file,      # Render from the scene's own file
             scene_name
         ]
-    else:
-        # Fall back to system manim command
-        cmd = [
-            "manim",
-            "-q" + quality,
-            scene_file,      # Render from the scene's own file
-            scene_name
-        ]
+    
+    # Fall back to system manim command
+    return [
+        "manim",
+        "-q" + quality,
+        *extra_args,
+        scene_file,      # Render from the scene's own file
+        scene_name
+    ]
+
+
+def _run_manim(cmd, scene_name, stream):
+    """
+    Run a render command and return the resource usage of the manim process
+    
+    With stream=True every line of output is prefixed with the scene name.
+    The usage is None on platforms without os.wait4 (Windows).
+    """
+    pipe = subprocess.PIPE if stream else None
+    process = subprocess.Popen(
+        cmd,
+        env=_subprocess_env(),
+        stdout=pipe,
+        stderr=subprocess.STDOUT if stream else None,
+        text=True,
+        errors="replace"
+    )
+    if stream:
+        # Universal newlines turn manim's carriage-return progress updates into lines
+        with process.stdout:
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    _log(f"[{scene_name}] {line}")
+    
+    usage = None
+    if hasattr(os, "wait4"):
+        # Reap the process ourselves to get its own CPU time and peak memory
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    return usage
+
+
+def _count_frames(video_path):
+    """Number of video frames in a file, or None without ffprobe"""
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe or not os.path.exists(video_path):
+        return None
+    result = subprocess.run(
+        [ffprobe, "-v", "error", "-select_streams", "v:0", "-count_packets",
+         "-show_entries", "stream=nb_read_packets", "-of", "csv=p=0", video_path],
+        capture_output=True,
+        text=True
+    )
+    try:
+        return int(result.stdout.strip())
+    except ValueError:
+        return None
+
+
+def _probe_video(video_path):
+    """Codec parameters of a file's video stream (the ones concat needs to match)"""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-show_entries",
+         "stream=codec_name,profile,level,width,height,pix_fmt,r_frame_rate,time_base",
+         "-of", "json", video_path],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    streams = json.loads(result.stdout).get("streams", [])
+    if not streams:
+        raise RuntimeError(f"{video_path} has no video stream")
+    return streams[0]
+
+
+def _recorded_frames(scene_name, quality):
+    """Frame count recorded with the last render of a scene (see record_render)"""
+    with _cache_lock:
+        return _load_cache()["frames"].get(f"{scene_name}:{quality}")
+
+
+_telemetry_lock = threading.Lock()
+
+
+def log_render(scene_name, quality, status, wall_time, usage=None):
+    """
+    Append one telemetry record for a render attempt
+    
+    Args:
+        scene_name: Name of the scene class
+        quality: Render quality flag
+        status: "rendered", "cached" or "failed"
+        wall_time: Elapsed seconds, including the cache check
+        usage: Resource usage of the manim process (from os.wait4), if any
+    """
+    output = scene_output_path(scene_name, quality)
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scene": scene_name,
+        "quality": quality,
+        "status": status,
+        "cache_hit": status == "cached",
+        "wall_time": round(wall_time, 3),
+        "cpu_time": None,
+        "peak_rss_mb": None,
+        "frames": _recorded_frames(scene_name, quality) if status != "failed" else None,
+        "output_bytes": os.path.getsize(output) if status != "failed" and os.path.exists(output) else None
+    }
+    if usage is not None:
+        # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+        rss_unit = 1 if sys.platform == "darwin" else 1024
+        record["cpu_time"] = round(usage.ru_utime + usage.ru_stime, 3)
+        record["peak_rss_mb"] = round(usage.ru_maxrss * rss_unit / (1024 * 1024), 1)
+    
+    with _telemetry_lock:
+        os.makedirs(os.path.dirname(TELEMETRY_FILE), exist_ok=True)
+        with open(TELEMETRY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+def render_scene(scene_name, quality="l", stream=False, force=False):
+    """
+    Render a specific scene from its module file
+    
+    The render is skipped when the existing output was produced from the
+    same scene module, helpers, config, quality and assets.
+    
+    Args:
+        scene_name: Name of the scene class to render
+        quality: Render quality (l=low, m=medium, h=high, k=4k)
+        stream: Tag every output line with the scene name, for renders
+                that share the terminal with other jobs
+        force: Render even if the cached output is up to date
+    """
+    # Get the scene file path
+    if scene_name not in SCENES:
+        _log(f"Error: Scene '{scene_name}' not found")
+        return False
+    
+    start = time.perf_counter()
+    fingerprint = scene_fingerprint(scene_name, quality)
+    if not force and is_cached(scene_name, quality, fingerprint):
+        log_render(scene_name, quality, "cached", time.perf_counter() - start)
+        _log(f"✓ {scene_name} is up to date: {scene_output_path(scene_name, quality)}")
+        return True
+    
+    if not stream:
+        print(f"\n{'='*60}")
+        print(f"Rendering scene: {scene_name}")
+        print(f"{'='*60}\n")
+    
+    cmd = manim_command(scene_name, quality)
     
     try:
         # Run the command
-        result = subprocess.run(cmd, check=True)
-        print(f"\n✓ Successfully rendered {scene_name}")
+        render_start = time.perf_counter()
+        usage = _run_manim(cmd, scene_name, stream)
+        record_render(scene_name, quality, fingerprint, time.perf_counter() - render_start)
+        log_render(scene_name, quality, "rendered", time.perf_counter() - start, usage)
+        _log(f"\n✓ Successfully rendered {scene_name}")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"\n✗ Error rendering {scene_name}: {e}")
+        log_render(scene_name, quality, "failed", time.perf_counter() - start)
+        _log(f"\n✗ Error rendering {scene_name}: {e}")
         return False
     except FileNotFoundError:
-        print("\n✗ Error: manim command not found. Make sure Manim is installed.")
-        print("   Install with: pip install manim")
-        print(f"   Or activate your virtual environment first")
+        _log("\n✗ Error: manim command not found. Make sure Manim is installed.\n"
+             "   Install with: pip install manim\n"
+             "   Or activate your virtual environment first")
         return False
 
 
-def render_all_scenes(quality="l"):
-    """Render all scenes"""
-    print(f"\nRendering all {len(SCENE_LIST)} scenes...")
+def render_scenes_in_process(scene_names, quality="l", force=False):
+    """
+    Render scenes one after another inside this interpreter
+    
+    manim, its font and tex setup and the scene modules are imported once
+    and shared by every scene instead of being paid for by one subprocess
+    per scene. Each scene renders under its own temporary config whose
+    input file is the scene's module, so the video lands exactly where
+    `manim <scene file> <Scene>` would write it.
+    
+    Args:
+        scene_names: Scenes to render, in order
+        quality: Render quality (l=low, m=medium, h=high, k=4k)
+        force: Render even if the cached output is up to date
+    
+    Returns:
+        List of scenes that failed
+    """
+    try:
+        import manim
+    except ImportError:
+        _log("\n✗ Error: manim is not importable from this Python. Make sure Manim is installed.\n"
+             "   Install with: pip install manim\n"
+             "   Or run this script with your virtual environment's Python")
+        return list(scene_names)
+    
+    failed_scenes = []
+    
+    for i, scene_name in enumerate(scene_names, 1):
+        start = time.perf_counter()
+        fingerprint = scene_fingerprint(scene_name, quality)
+        if not force and is_cached(scene_name, quality, fingerprint):
+            log_render(scene_name, quality, "cached", time.perf_counter() - start)
+            _log(f"✓ {scene_name} is up to date: {scene_output_path(scene_name, quality)}")
+            continue
+        
+        print(f"\n{'='*60}")
+        print(f"[{i}/{len(scene_names)}] Rendering scene in-process: {scene_name}")
+        print(f"{'='*60}\n")
+        
+        scene_file = SCENES[scene_name]
+        usage_before = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+        
+        try:
+            scene_class = load_scene(scene_name)
+            with manim.tempconfig({
+                "quality": QUALITY_NAMES[quality],
+                "input_file": os.path.abspath(scene_file),
+                "media_dir": MEDIA_DIR,
+                "preview": False
+            }):
+                scene_class().render()
+        except Exception as e:
+            # One broken scene must not stop the rest of the batch
+            log_render(scene_name, quality, "failed", time.perf_counter() - start)
+            _log(f"\n✗ Error rendering {scene_name}: {e!r}")
+            failed_scenes.append(scene_name)
+            continue
+        
+        usage = None
+        if resource:
+            # CPU time is this scene's share; peak memory is the process-wide peak so far
+            usage_after = resource.getrusage(resource.RUSAGE_SELF)
+            usage = types.SimpleNamespace(
+                ru_utime=usage_after.ru_utime - usage_before.ru_utime,
+                ru_stime=usage_after.ru_stime - usage_before.ru_stime,
+                ru_maxrss=usage_after.ru_maxrss
+            )
+        record_render(scene_name, quality, fingerprint, time.perf_counter() - start)
+        log_render(scene_name, quality, "rendered", time.perf_counter() - start, usage)
+        _log(f"\n✓ Successfully rendered {scene_name}")
+    
+    return failed_scenes
+
+
+def render_all_scenes(quality="l", jobs=1, force=False, batch=False, scene_names=None):
+    """
+    Render all scenes (or the given subset)
+    
+    Args:
+        quality: Render quality (l=low, m=medium, h=high, k=4k)
+        jobs: Number of scenes to render at the same time
+        force: Render even if the cached output is up to date
+        batch: Render every scene in this process instead of one
+               manim subprocess per scene (jobs is ignored)
+        scene_names: Scenes to render, in playback order (default: all)
+    """
+    if scene_names is None:
+        scene_names = SCENE_LIST
+    print(f"\nRendering {len(scene_names)} scenes...")
     
     success_count = 0
     failed_scenes = []
     
-    for i, scene in enumerate(SCENE_LIST, 1):
-        print(f"\n[{i}/{len(SCENE_LIST)}]")
-        if render_scene(scene, quality):
-            success_count += 1
+    if batch:
+        failed_scenes = render_scenes_in_process(scene_names, quality, force)
+        success_count = len(scene_names) - len(failed_scenes)
+    elif jobs <= 1:
+        for i, scene in enumerate(scene_names, 1):
+            print(f"\n[{i}/{len(scene_names)}]")
+            if render_scene(scene, quality, force=force):
+                success_count += 1
+            else:
+                failed_scenes.append(scene)
+    else:
+        print(f"Running up to {jobs} renders in parallel")
+        
+        ordered, makespan, unknown = schedule_scenes(scene_names, quality, jobs, force)
+        print(f"Start order (longest first): {', '.join(ordered)}")
+        if makespan is None:
+            print("Predicted wall time: unknown (no render history yet)")
         else:
-            failed_scenes.append(scene)
+            print(f"Predicted wall time: {_format_duration(makespan)}")
+        if unknown and makespan is not None:
+            print(f"  (no render history for: {', '.join(unknown)})")
+        
+        # Each worker only waits on its own manim process,
+        # so threads are enough to keep every process busy.
+        # The pool starts jobs in submission order.
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(render_scene, scene, quality, True, force): scene
+                for scene in ordered
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                scene = futures[future]
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    # A crashed job must not take the remaining renders down with it
+                    _log(f"\n✗ Error rendering {scene}: {e}")
+                    ok = False
+                
+                _log(f"[{done}/{len(scene_names)}] {scene} {'finished' if ok else 'failed'}")
+                if ok:
+                    success_count += 1
+                else:
+                    failed_scenes.append(scene)
+        
+        # Report failures in playback order rather than completion order
+        failed_scenes.sort(key=scene_names.index)
     
     # Summary
     print(f"\n{'='*60}")
     print(f"SUMMARY")
     print(f"{'='*60}")
-    print(f"Successfully rendered: {success_count}/{len(SCENE_LIST)} scenes")
+    print(f"Successfully rendered: {success_count}/{len(scene_names)} scenes")
     
     if failed_scenes:
         print(f"\nFailed scenes:")
@@ -120,52 +748,767 @@ def render_all_scenes(quality="l"):
     else:
         print("\n✓ All scenes rendered successfully!")
     
-    return success_count == len(SCENE_LIST)
+    return success_count == len(scene_names)
+
+
+def _watch_snapshot():
+    """Modification time and size of every watched file"""
+    roots = WATCH_PATHS + [asset for assets in SCENE_ASSETS.values() for asset in assets]
+    snapshot = {}
+    for root in roots:
+        if os.path.isdir(root):
+            for directory, dirs, files in os.walk(root):
+                dirs[:] = [d for d in dirs if d != "__pycache__"]
+                for name in files:
+                    path = os.path.join(directory, name).replace(os.sep, "/")
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue  # Deleted while scanning
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        elif os.path.exists(root):
+            stat = os.stat(root)
+            snapshot[root] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _changed_paths(before, after):
+    return {
+        path for path in before.keys() | after.keys()
+        if before.get(path) != after.get(path)
+    }
+
+
+def affected_scenes(changed_paths):
+    """
+    Scenes whose output depends on any of the changed files
+    
+    Added and deleted files inside an asset folder count as changes to that
+    folder, so a new PNG in images/water_sky affects CAMShowcase only.
+    """
+    affected = []
+    for scene_name in SCENE_LIST:
+        dependencies = set(scene_dependencies(scene_name))
+        folders = [
+            asset.rstrip("/") + "/" for asset in SCENE_ASSETS.get(scene_name, [])
+            if os.path.isdir(asset)
+        ]
+        if any(path in dependencies or path.startswith(tuple(folders))
+               for path in changed_paths):
+            affected.append(scene_name)
+    return affected
+
+
+def watch_scenes(quality="l", jobs=1, interval=0.5, debounce=1.0):
+    """
+    Watch the scenes, main.py, manim.cfg and the assets, and re-render the
+    scenes affected by each change
+    
+    A burst of saves is collected until nothing has changed for `debounce`
+    seconds, then rendered once. Scenes whose inputs turn out to be
+    unchanged (e.g. a file was only touched) are served from the cache.
+    Renders always run as subprocesses so edited modules are re-imported.
+    
+    Args:
+        quality: Render quality (low by default for fast iteration)
+        jobs: Number of scenes to render at the same time
+        interval: Seconds between polls of the file system
+        debounce: Quiet period in seconds that ends a burst of changes
+    """
+    print(f"Watching {', '.join(WATCH_PATHS)} and scene assets (Ctrl+C to stop)")
+    previous = _watch_snapshot()
+    
+    try:
+        while True:
+            time.sleep(interval)
+            current = _watch_snapshot()
+            changed = _changed_paths(previous, current)
+            if not changed:
+                continue
+            
+            # Debounce: keep collecting changes until the tree is quiet
+            while True:
+                time.sleep(debounce)
+                latest = _watch_snapshot()
+                burst = _changed_paths(current, latest)
+                if not burst:
+                    break
+                changed |= burst
+                current = latest
+            previous = current
+            
+            print(f"\nChanged: {', '.join(sorted(changed))}")
+            scenes = affected_scenes(changed)
+            if "main.py" in changed:
+                print("main.py only affects the compositions; no scene needs re-rendering for it")
+            if not scenes:
+                print("No scenes affected")
+                continue
+            
+            render_all_scenes(quality, jobs, scene_names=scenes)
+            print(f"\nWatching for changes...")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def count_animations(scene_name):
+    """Number of play()/wait() calls in a scene, found with a dry run"""
+    python = _venv_python() or sys.executable
+    result = subprocess.run(
+        [python, "-c", _COUNT_PLAYS, SCENES[scene_name], scene_name],
+        env=_subprocess_env(),
+        capture_output=True,
+        text=True
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("NUM_PLAYS"):
+            return int(line.split()[1])
+    raise RuntimeError(f"Could not count the animations of {scene_name}:\n{result.stderr}")
+
+
+def split_ranges(num_plays, parts):
+    """
+    Divide animation indices 0..num_plays-1 into contiguous inclusive ranges
+    
+    Every range holds at least two animations: manim treats an end index of 0
+    as "no limit", so a lone [0, 0] range would render the whole scene.
+    """
+    parts = max(1, min(parts, num_plays // 2))
+    bounds = [round(i * num_plays / parts) for i in range(parts + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(parts)]
+
+
+def render_scene_split(scene_name, quality="l", parts=2, force=False):
+    """
+    Render one scene as several animation ranges in parallel and join them
+    
+    Each range runs in its own manim process with -n start,end and its own
+    media folder. The partial videos are joined with ffmpeg's concat demuxer
+    using stream copy, so every frame is the one a single-process render
+    would have encoded. Needs a deterministic scene (seeded randomness),
+    since every process replays construct() from the start.
+    
+    Args:
+        scene_name: Name of the scene class to render
+        quality: Render quality (l=low, m=medium, h=high, k=4k)
+        parts: Number of ranges (processes)
+        force: Render even if the cached output is up to date
+    """
+    if scene_name not in SCENES:
+        _log(f"Error: Scene '{scene_name}' not found")
+        return False
+    
+    start = time.perf_counter()
+    fingerprint = scene_fingerprint(scene_name, quality)
+    if not force and is_cached(scene_name, quality, fingerprint):
+        log_render(scene_name, quality, "cached", time.perf_counter() - start)
+        _log(f"✓ {scene_name} is up to date: {scene_output_path(scene_name, quality)}")
+        return True
+    
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        _log("\n✗ Error: ffmpeg is required to join split renders")
+        return False
+    
+    try:
+        num_plays = count_animations(scene_name)
+    except (RuntimeError, FileNotFoundError) as e:
+        _log(f"\n✗ Error: {e}")
+        return False
+    
+    ranges = split_ranges(num_plays, parts)
+    print(f"\n{'='*60}")
+    print(f"Rendering scene: {scene_name} ({num_plays} animations in {len(ranges)} ranges)")
+    print(f"{'='*60}\n")
+    
+    work_dir = os.path.join(SPLIT_DIR, scene_name, quality)
+    shutil.rmtree(work_dir, ignore_errors=True)
+    module_name = os.path.splitext(os.path.basename(SCENES[scene_name]))[0]
+    
+    def render_range(index):
+        first, last = ranges[index]
+        media_dir = os.path.join(work_dir, f"part{index}")
+        cmd = manim_command(scene_name, quality, [
+            "-n", f"{first},{last}",
+            "--media_dir", media_dir,
+            # Uncached partial files make the per-range animation count checkable
+            "--disable_caching"
+        ])
+        _run_manim(cmd, f"{scene_name}#{index}", stream=True)
+        
+        video_dir = os.path.join(media_dir, "videos", module_name, QUALITY_DIRS[quality])
+        partial_dir = os.path.join(video_dir, "partial_movie_files", scene_name)
+        rendered = len([f for f in os.listdir(partial_dir) if f.endswith(".mp4")])
+        if rendered != last - first + 1:
+            raise RuntimeError(
+                f"range {first}-{last} produced {rendered} animations, "
+                f"expected {last - first + 1}"
+            )
+        return os.path.abspath(os.path.join(video_dir, f"{scene_name}.mp4"))
+    
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            part_files = list(pool.map(render_range, range(len(ranges))))
+        
+        list_file = os.path.join(work_dir, "parts.txt")
+        with open(list_file, "w", encoding="utf-8") as f:
+            for path in part_files:
+                f.write(f"file '{path}'\n")
+        
+        output = scene_output_path(scene_name, quality)
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", list_file, "-c", "copy", output],
+            check=True
+        )
+    except (subprocess.CalledProcessError, RuntimeError, OSError) as e:
+        log_render(scene_name, quality, "failed", time.perf_counter() - start)
+        _log(f"\n✗ Error rendering {scene_name}: {e}")
+        return False
+    
+    # The split wall time would make the scene look short to schedule_scenes
+    record_render(scene_name, quality, fingerprint)
+    log_render(scene_name, quality, "rendered", time.perf_counter() - start)
+    shutil.rmtree(work_dir, ignore_errors=True)
+    _log(f"\n✓ Successfully rendered {scene_name} from {len(ranges)} ranges")
+    return True
+
+
+def collect_texts(scene_names=None):
+    """
+    Find the texts (cached_text, cached_markup_text), MathTex and Tex
+    mobjects the scenes create
+    
+    The scene modules and the package modules they import are parsed, not
+    imported. Only calls whose arguments are literals or names (constants
+    such as BOLD or CAS_GREEN) are collected; texts built from computed
+    values are left to the render.
+    
+    Args:
+        scene_names: Scenes to scan (default: all)
+    
+    Returns:
+        Sorted list of unique (module name, call source) pairs
+    """
+    paths = []
+    for scene_name in scene_names or SCENES:
+        paths += [path for path in scene_modules(scene_name) if path not in paths]
+    
+    calls = set()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        module_name = os.path.splitext(os.path.basename(path))[0]
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                    and node.func.id in WARM_CALLS):
+                continue
+            arguments = node.args + node.keywords
+            if all(isinstance(part, _WARM_NODES) for arg in arguments for part in ast.walk(arg)):
+                calls.add((module_name, ast.unparse(node)))
+    return sorted(calls)
+
+
+def _warm_text(module_name, source):
+    """
+    Build one collected mobject in a pool process, filling the text and tex caches
+    
+    The call is evaluated in its module's namespace, so the scenes.texts
+    factories and constants resolve to the module's imports. Returns
+    "built", "computed" when an argument is a local of the scene (left to
+    the render), or the error.
+    """
+    import importlib
+    import manim
+    
+    try:
+        module = importlib.import_module(f"{SCENES_PACKAGE}.{module_name}")
+        with manim.tempconfig({"media_dir": MEDIA_DIR}):
+            eval(source, vars(module))
+    except NameError:
+        return "computed"
+    except Exception as e:
+        return repr(e)
+    return "built"
+
+
+def warm_cache(scene_names=None, jobs=None):
+    """
+    Compile the scenes' Text and TeX before rendering, in a process pool
+    
+    cached_text and cached_markup_text fill the geometry cache of scenes/texts.py; MathTex
+    and Tex run LaTeX and dvisvgm once into manim's tex folder under
+    media/. Renders started afterwards load them instead of blocking on Pango
+    or LaTeX inside construct().
+    
+    Args:
+        scene_names: Scenes whose texts are compiled (default: all)
+        jobs: Number of processes (default: one per CPU)
+    
+    Returns:
+        List of (module name, call source, error) for the calls that failed,
+        or None without manim
+    """
+    try:
+        import manim
+    except ImportError:
+        _log("\n✗ Error: manim is not importable from this Python. Make sure Manim is installed.")
+        return None
+    
+    start = time.perf_counter()
+    calls = collect_texts(scene_names)
+    jobs = jobs or os.cpu_count() or 1
+    _log(f"\nWarming {len(calls)} texts in {jobs} processes")
+    
+    counts = {"built": 0, "computed": 0}
+    failures = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_warm_text, module, source): (module, source)
+                   for module, source in calls}
+        for future in as_completed(futures):
+            module, source = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # A crashed worker process
+                result = repr(e)
+            if result in counts:
+                counts[result] += 1
+            else:
+                failures.append((module, source, result))
+                _log(f"✗ {module}: {source.splitlines()[0]} -> {result}")
+    
+    _log(f"\n✓ Built {counts['built']} texts in {_format_duration(time.perf_counter() - start)}"
+         f" ({counts['computed']} use values computed in construct() and are left to the render,"
+         f" {len(failures)} failed)")
+    return failures
+
+
+def _hold_clip(video_path, seconds, stream, hold_dir):
+    """
+    Video of the last frame of a scene held for a number of seconds,
+    encoded like manim's own output so it can be joined by stream copy
+    
+    The clip is reused while it is newer than the scene video.
+    """
+    scene_name = os.path.splitext(os.path.basename(video_path))[0]
+    clip_path = os.path.join(hold_dir, f"{scene_name}_{seconds:g}s.mp4")
+    if (os.path.exists(clip_path)
+            and os.path.getmtime(clip_path) >= os.path.getmtime(video_path)):
+        return clip_path
+    
+    os.makedirs(hold_dir, exist_ok=True)
+    frame_path = os.path.join(hold_dir, f"{scene_name}_last.png")
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-sseof", "-1", "-i", video_path,
+         "-update", "1", frame_path],
+        check=True
+    )
+    
+    fps = stream["r_frame_rate"]
+    num, den = (int(x) for x in fps.split("/"))
+    frames = max(1, round(seconds * num / den))
+    # Match the probed stream so compose_video can join the clip by stream copy
+    codec_args = ["-c:v", "libx264", "-pix_fmt", stream["pix_fmt"], "-r", fps]
+    # ffprobe names H.264 profiles like "High" or "Constrained Baseline", libx264 like "high"
+    profile = stream.get("profile", "").lower().replace("constrained ", "")
+    if profile in ("baseline", "main", "high"):
+        codec_args += ["-profile:v", profile]
+    if stream.get("level", 0) > 0:
+        # ffprobe reports level 3.1 as 31
+        codec_args += ["-level", f"{stream['level'] / 10:g}"]
+    if "time_base" in stream:
+        codec_args += ["-video_track_timescale", stream["time_base"].split("/")[1]]
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-loop", "1", "-framerate", fps,
+         "-i", frame_path, "-frames:v", str(frames),
+         *codec_args, "-crf", "23", clip_path],
+        check=True
+    )
+    os.remove(frame_path)
+    return clip_path
+
+
+def load_manifest(path=MANIFEST_FILE):
+    """
+    Read and validate the composition manifest
+    
+    Returns:
+        {name: {"description": str, "quality": flag, "scenes": [(scene, hold seconds), ...]}}
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    
+    compositions = {}
+    for name, spec in data["compositions"].items():
+        quality = spec.get("quality", "h")
+        if quality not in QUALITY_DIRS:
+            raise ValueError(f"{name}: invalid quality '{quality}'")
+        entries = []
+        for entry in spec["scenes"]:
+            if entry["scene"] not in SCENES:
+                raise ValueError(f"{name}: unknown scene '{entry['scene']}'")
+            entries.append((entry["scene"], float(entry.get("hold", 0))))
+        compositions[name] = {
+            "description": spec.get("description", ""),
+            "quality": quality,
+            "scenes": entries
+        }
+    return compositions
+
+
+def build_render_graph(compositions, quality=None):
+    """
+    Merge the compositions into one dependency graph
+    
+    Every composition depends on one render job per (scene, quality). Jobs
+    shared by several compositions appear once, so EvolutionaryTree renders
+    once per quality however many compositions use it.
+    
+    Args:
+        compositions: Parsed manifest (see load_manifest)
+        quality: Override the manifest quality of every composition
+    
+    Returns:
+        (render jobs grouped as {quality: [scenes in registry order]},
+         {composition: (quality, [(scene, hold), ...])})
+    """
+    jobs = {}
+    targets = {}
+    for name, spec in compositions.items():
+        composition_quality = quality or spec["quality"]
+        targets[name] = (composition_quality, spec["scenes"])
+        needed = jobs.setdefault(composition_quality, set())
+        needed.update(scene for scene, _ in spec["scenes"])
+    
+    jobs = {
+        q: [scene for scene in SCENES if scene in needed]
+        for q, needed in jobs.items()
+    }
+    return jobs, targets
+
+
+def compose_video(name, entries, quality="l", force=False):
+    """
+    Build a composition by joining per-scene videos
+    
+    Each scene's cached output is followed by its last frame held for the
+    composition's pause. Segments are joined with ffmpeg's concat demuxer
+    by stream copy when their codec parameters match, and re-encoded
+    otherwise. Nothing is re-rendered here: missing scene videos are an
+    error (compose_all renders them first).
+    
+    Args:
+        name: Composition name
+        entries: (scene, seconds to hold its last frame) pairs, in order
+        quality: Quality of the scene videos to join
+        force: Rebuild even if no segment changed since the last build
+    
+    Returns:
+        Path of the composed video
+    """
+    quality_dir = QUALITY_DIRS[quality]
+    output = os.path.join(COMPOSITION_DIR, quality_dir, f"{name}.mp4")
+    hold_dir = os.path.join(COMPOSITION_DIR, quality_dir, "holds")
+    
+    segments = []
+    for scene_name, hold in entries:
+        video_path = scene_output_path(scene_name, quality)
+        if not os.path.exists(video_path):
+            raise RuntimeError(f"{scene_name} has not been rendered at quality '{quality}'")
+        segments.append(video_path)
+        if hold > 0:
+            segments.append(_hold_clip(video_path, hold, _probe_video(video_path), hold_dir))
+    
+    # Skip the join when every segment is the same file as last time
+    signature = [
+        [path, os.stat(path).st_mtime_ns, os.stat(path).st_size] for path in segments
+    ]
+    key = f"{name}:{quality}"
+    with _cache_lock:
+        unchanged = _load_cache()["compositions"].get(key) == signature
+    if unchanged and not force and os.path.exists(output):
+        _log(f"✓ {name} is up to date: {output}")
+        return output
+    
+    streams = [_probe_video(path) for path in segments]
+    stream_copy = all(stream == streams[0] for stream in streams)
+    if not stream_copy:
+        mismatched = sorted({
+            key for stream in streams for key in stream.keys() | streams[0].keys()
+            if stream.get(key) != streams[0].get(key)
+        })
+        _log(f"{name}: segments differ in {', '.join(mismatched)}, re-encoding instead of stream copy")
+    
+    list_file = os.path.join(COMPOSITION_DIR, quality_dir, f"{name}.txt")
+    with open(list_file, "w", encoding="utf-8") as f:
+        for path in segments:
+            f.write(f"file '{os.path.abspath(path)}'\n")
+    
+    codec_args = ["-c", "copy"] if stream_copy else ["-c:v", "libx264", "-pix_fmt", "yuv420p"]
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", list_file, *codec_args, output],
+        check=True
+    )
+    os.remove(list_file)
+    
+    with _cache_lock:
+        _load_cache()["compositions"][key] = signature
+        _save_cache()
+    _log(f"✓ Composed {name} ({'stream copy' if stream_copy else 're-encoded'}): {output}")
+    return output
+
+
+def compose_all(quality=None, jobs=1, force=False, manifest=MANIFEST_FILE):
+    """
+    Render every scene the manifest's compositions need, once per quality
+    (cached scenes are reused), then build each composition from the videos
+    
+    A composition is skipped when one of its scenes failed to render.
+    
+    Args:
+        quality: Override the manifest quality of every composition
+        jobs: Number of scenes to render at the same time
+        force: Rebuild compositions even if their segments are unchanged
+        manifest: Path of the composition manifest
+    """
+    if not (shutil.which("ffmpeg") and shutil.which("ffprobe")):
+        print("✗ Error: ffmpeg and ffprobe are required to compose videos")
+        return False
+    
+    try:
+        compositions = load_manifest(manifest)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"✗ Error reading {manifest}: {e!r}")
+        return False
+    
+    render_jobs, targets = build_render_graph(compositions, quality)
+    total_uses = sum(len(entries) for _, entries in targets.values())
+    total_jobs = sum(len(scenes) for scenes in render_jobs.values())
+    print(f"\n{len(targets)} compositions use {total_uses} scenes: "
+          f"{total_jobs} unique render jobs")
+    
+    for job_quality, scenes in render_jobs.items():
+        render_all_scenes(job_quality, jobs, scene_names=scenes)
+    
+    print(f"\n{'='*60}")
+    print(f"Composing {len(targets)} videos")
+    print(f"{'='*60}")
+    
+    ok = True
+    for name, (composition_quality, entries) in targets.items():
+        missing = [
+            scene for scene, _ in entries
+            if not is_cached(scene, composition_quality, scene_fingerprint(scene, composition_quality))
+        ]
+        if missing:
+            print(f"✗ Skipping {name}: {', '.join(missing)} did not render")
+            ok = False
+            continue
+        try:
+            compose_video(name, entries, composition_quality, force)
+        except (subprocess.CalledProcessError, RuntimeError, OSError) as e:
+            print(f"✗ Error composing {name}: {e}")
+            ok = False
+    return ok
+
+
+def _format_size(num_bytes):
+    if num_bytes is None:
+        return "-"
+    for unit in ["B", "KB", "MB"]:
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f}{unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f}GB"
+
+
+def print_report(quality=None):
+    """
+    Summarise the telemetry log per scene and quality
+    
+    Scenes are listed from most to least expensive (median wall time of real
+    renders). A scene is flagged when its latest render took more than 20%
+    longer than the median of its earlier renders.
+    
+    Args:
+        quality: Only include renders at this quality (all qualities if None)
+    """
+    try:
+        with open(TELEMETRY_FILE, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        print(f"No telemetry recorded yet ({TELEMETRY_FILE} not found)")
+        return
+    
+    groups = {}
+    for record in records:
+        if quality and record["quality"] != quality:
+            continue
+        groups.setdefault((record["scene"], record["quality"]), []).append(record)
+    
+    if not groups:
+        print("No matching telemetry records")
+        return
+    
+    rows = []
+    for (scene, q), runs in groups.items():
+        rendered = [r for r in runs if r["status"] == "rendered"]
+        walls = [r["wall_time"] for r in rendered]
+        latest = rendered[-1] if rendered else None
+        
+        trend = "-"
+        if len(walls) >= 2:
+            baseline = statistics.median(walls[:-1])
+            change = (walls[-1] - baseline) / baseline * 100 if baseline else 0.0
+            trend = f"{change:+.0f}%" + (" !" if change > 20 else "")
+        
+        rss_values = [r["peak_rss_mb"] for r in rendered if r.get("peak_rss_mb") is not None]
+        rows.append({
+            "scene": scene,
+            "quality": q,
+            "runs": len(runs),
+            "hit_rate": sum(r["cache_hit"] for r in runs) / len(runs),
+            "failures": sum(r["status"] == "failed" for r in runs),
+            "median": statistics.median(walls) if walls else None,
+            "latest": walls[-1] if walls else None,
+            "trend": trend,
+            "cpu": latest.get("cpu_time") if latest else None,
+            "rss": max(rss_values) if rss_values else None,
+            "frames": latest.get("frames") if latest else None,
+            "size": latest.get("output_bytes") if latest else None
+        })
+    
+    rows.sort(key=lambda row: -(row["median"] or 0))
+    
+    def fmt(value, spec):
+        return "-" if value is None else format(value, spec)
+    
+    header = (f"{'Scene':<24}{'Q':<3}{'Runs':>5}{'Hits':>6}{'Fail':>5}"
+              f"{'Median':>9}{'Latest':>9}{'Trend':>8}{'CPU':>9}{'PeakMB':>8}"
+              f"{'Frames':>8}{'Size':>8}")
+    print(f"\n{'='*len(header)}")
+    print(f"RENDER REPORT ({TELEMETRY_FILE})")
+    print(f"{'='*len(header)}")
+    print(header)
+    for row in rows:
+        print(f"{row['scene']:<24}{row['quality']:<3}{row['runs']:>5}"
+              f"{row['hit_rate']:>6.0%}{row['failures']:>5}"
+              f"{fmt(row['median'], '.1f'):>9}{fmt(row['latest'], '.1f'):>9}{row['trend']:>8}"
+              f"{fmt(row['cpu'], '.1f'):>9}{fmt(row['rss'], '.0f'):>8}"
+              f"{fmt(row['frames'], 'd'):>8}{_format_size(row['size']):>8}")
+    print("\nTimes in seconds. Trend compares the latest render with the median of earlier ones.")
+
+
+def _print_available_scenes():
+    print(f"\nAvailable scenes:")
+    for i, scene in enumerate(SCENE_LIST, 1):
+        print(f"  {i}. {scene}")
+    for scene in SCENES:
+        if scene not in SCENE_LIST:
+            print(f"  -  {scene}")
 
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Render each scene of the CAS video individually",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "scene", nargs="?", default="all",
+        help="Scene number (1-%d) or name, 'all' (default), 'report', 'watch', 'compose' "
+             "or 'warm-cache'" % len(SCENE_LIST)
+    )
+    parser.add_argument(
+        "quality", nargs="?", default=None,
+        help="l (low, default), m (medium), h (high), p (production), k (4k)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Number of scenes to render in parallel (default: 1; "
+             "for 'warm-cache', processes, default: one per CPU)"
+    )
+    parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="Re-render scenes even if their cached output is up to date"
+    )
+    parser.add_argument(
+        "-s", "--split", type=int, default=1, metavar="N",
+        help="Render a single scene as N animation ranges in parallel (needs ffmpeg)"
+    )
+    parser.add_argument(
+        "-b", "--batch", action="store_true",
+        help="Render in this process, importing manim once for all scenes"
+    )
+    parser.add_argument(
+        "--manifest", default=MANIFEST_FILE,
+        help="Composition manifest used by 'compose' (default: %(default)s)"
+    )
+    args = parser.parse_args()
+    
     # Default quality (can be modified)
     quality = "l"  # l=low (480p), m=medium (720p), h=high (1080p), k=4k
     
     # Check for quality argument
-    if len(sys.argv) > 2:
-        quality_arg = sys.argv[2].lower()
-        if quality_arg in ["l", "m", "h", "p", "k"]:
-            quality = quality_arg
-        else:
-            print(f"Warning: Invalid quality '{quality_arg}'. Using default 'l'")
-            print("Valid options: l (low), m (medium), h (high), p (production), k (4k)")
+    quality_arg = (args.quality or quality).lower()
+    if quality_arg in ["l", "m", "h", "p", "k"]:
+        quality = quality_arg
+    else:
+        print(f"Warning: Invalid quality '{quality_arg}'. Using default 'l'")
+        print("Valid options: l (low), m (medium), h (high), p (production), k (4k)")
     
-    # Check if a specific scene number was provided
-    if len(sys.argv) > 1:
-        arg = sys.argv[1]
-        
-        # Check if it's "all"
-        if arg.lower() == "all":
-            render_all_scenes(quality)
-            return
-        
+    jobs = max(1, args.jobs or 1)
+    arg = args.scene
+    
+    if arg.lower() == "warm-cache":
+        warm_cache(jobs=max(1, args.jobs) if args.jobs else None)
+        return
+    
+    if arg.lower() == "report":
+        # Without an explicit quality the report covers every quality
+        print_report(quality if args.quality else None)
+        return
+    
+    if arg.lower() == "watch":
+        watch_scenes(quality, jobs)
+        return
+    
+    if arg.lower() == "compose":
+        # Without an explicit quality each composition uses its manifest quality
+        compose_all(quality if args.quality else None, jobs, args.force, args.manifest)
+        return
+    
+    # Check if it's "all"
+    if arg.lower() == "all":
+        render_all_scenes(quality, jobs, args.force, args.batch)
+        return
+    
+    if arg in SCENES:
+        scene_name = arg
+        print(f"\nRendering scene: {scene_name}")
+    else:
         try:
             scene_num = int(arg)
-            if 1 <= scene_num <= len(SCENE_LIST):
-                scene_name = SCENE_LIST[scene_num - 1]
-                print(f"\nRendering scene #{scene_num}: {scene_name}")
-                render_scene(scene_name, quality)
-            else:
-                print(f"Error: Scene number must be between 1 and {len(SCENE_LIST)}")
-                print(f"\nAvailable scenes:")
-                for i, scene in enumerate(SCENE_LIST, 1):
-                    print(f"  {i}. {scene}")
         except ValueError:
-            print("Error: Please provide a valid scene number or 'all'")
-            print(f"\nAvailable scenes:")
-            for i, scene in enumerate(SCENE_LIST, 1):
-                print(f"  {i}. {scene}")
+            print("Error: Please provide a valid scene number, scene name or 'all'")
+            _print_available_scenes()
+            return
+        if not 1 <= scene_num <= len(SCENE_LIST):
+            print(f"Error: Scene number must be between 1 and {len(SCENE_LIST)}")
+            _print_available_scenes()
+            return
+        scene_name = SCENE_LIST[scene_num - 1]
+        print(f"\nRendering scene #{scene_num}: {scene_name}")
+    
+    if args.split > 1:
+        render_scene_split(scene_name, quality, args.split, args.force)
+    elif args.batch:
+        render_scenes_in_process([scene_name], quality, args.force)
     else:
-        # Render all scenes
-        render_all_scenes(quality)
-
+        render_scene(scene_name, quality, force=args.force)
 
 if __name__ == "__main__":
     main()
@@ -1,20 +1,18 @@
 """
 Scenes package for CAS (Cultural Alien Sampler) video
+
+Scene classes are found by scenes.registry without importing them and are
+loaded on first access (e.g. `from scenes import CAMShowcase`), so importing
+the package does not import manim.
 """
-from .general_problem import GeneralProblem
-from .creative_paradox import CreativeParadox
-from .concept_reframing import ConceptReframing
-from .llm_problem import LLMProblem
-from .open_ended_agent import OpenEndedAgent
-from .introducing_cas_solution import IntroducingCASSolution
+from .registry import discover_scenes, load_scene
+
+__all__ = list(discover_scenes())
+
 
-__all__ = [
-    'GeneralProblem',
-    'CreativeParadox',
-    'ConceptReframing',
-    'LLMProblem',
-    'OpenEndedAgent',
-    'IntroducingCASSolution',
-    'EvolutionaryTree',
-    'CAMShowcase'
-]
\ No newline at end of file
+def __getattr__(name):
+    if name in discover_scenes():
+        scene_class = load_scene(name)
+        globals()[name] = scene_class
+        return scene_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
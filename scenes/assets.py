@@ -0,0 +1,460 @@
+"""
+Image asset loading shared across scenes
+
+Images are decoded once into RGBA arrays scaled to the pixels they cover at
+the current render quality and stored as .npy files. Scenes map those files
+instead of decoding PNG/JPEG, so draft renders skip the full-resolution
+decode and parallel render processes share the same page cache.
+"""
+
+import json
+import math
+import os
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+from manim import *
+from manim.constants import DEFAULT_QUALITY, QUALITIES
+from PIL import Image
+
+from scenes.catalog import (
+    IMAGE_EXTENSIONS, PROJECT_DIR, generation_key, known_hash, sha256_file
+)
+
+
+# ============================================================================
+# CACHE LOCATION
+# ============================================================================
+# Shared by every scene and render process (entries are written atomically)
+CACHE_DIR = os.path.join(PROJECT_DIR, "media", "cache")
+
+# Pixel height ImageMobject maps to full frame height by default
+DEFAULT_RESOLUTION = QUALITIES[DEFAULT_QUALITY]["pixel_height"]
+
+
+def atomic_write(path: str, write: Callable[[str], None]):
+    """Create or replace a file so that no reader ever sees it half written
+
+    write(tmp_path) writes the content under a name private to this process
+    and thread, which is then renamed to `path`. If write raises, the
+    temporary file is removed and the error propagates.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# ============================================================================
+# CONTENT HASHING
+# ============================================================================
+_hashes = {}
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file's content, memoized while its size and mtime are unchanged"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _hashes:
+        # Cataloged images are not read again
+        _hashes[key] = known_hash(path, stat) or sha256_file(path)
+    return _hashes[key]
+
+
+# ============================================================================
+# DECODED ARRAY CACHE
+# ============================================================================
+def cached_array(name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+    """Memory-mapped array stored in the cache, built on first use
+
+    The array is mapped copy-on-write: pages are shared with every other
+    process mapping the same file, and in-place edits (such as
+    ImageMobject.set_opacity) stay private to the process.
+
+    Args:
+        name: Cache file name, unique for the array's content
+        build: Produces the array when it is not cached yet
+
+    Returns:
+        The mapped array
+    """
+    def write(tmp_path):
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(build()))
+
+    return _cached_file(name, write)
+
+
+def _cached_file(name: str, write: Callable[[str], None]) -> np.ndarray:
+    """Map a cached .npy file, calling write(tmp_path) to create it if missing"""
+    path = os.path.join(CACHE_DIR, "decoded", f"{name}.npy")
+    if not os.path.exists(path):
+        # Concurrent renders never map a partial file
+        atomic_write(path, write)
+    return np.load(path, mmap_mode="c")
+
+
+# ============================================================================
+# PER-QUALITY DECODED IMAGES
+# ============================================================================
+def pixels_for_height(height: float) -> int:
+    """Number of output pixels covered by `height` scene units at the current quality"""
+    return max(1, math.ceil(height / config.frame_height * config.pixel_height))
+
+
+def natural_height(path: str) -> float:
+    """Height in scene units that ImageMobject(path) would have"""
+    with Image.open(path) as image:
+        return image.height / DEFAULT_RESOLUTION * config.frame_height
+
+
+def scaled_size(source_size: Tuple[int, int], height: float) -> Tuple[int, int]:
+    """Pixel size (width, height) of a source shown `height` units tall, never upscaled"""
+    source_width, source_height = source_size
+    target_height = min(pixels_for_height(height), source_height)
+    target_width = max(1, round(source_width * target_height / source_height))
+    return target_width, target_height
+
+
+def to_rgba(image: Image.Image, size: Tuple[int, int]) -> np.ndarray:
+    """RGBA pixels of a PIL image resized to `size`"""
+    image = image.convert("RGBA")
+    if image.size != size:
+        image = image.resize(size, Image.Resampling.LANCZOS)
+    return np.asarray(image)
+
+
+def decoded_image(path: str, height: float) -> np.ndarray:
+    """RGBA pixels of an image scaled to the pixels it covers on screen
+
+    The pixels are cached by source content hash and target resolution, so
+    each quality level gets its own copy and edited sources are picked up.
+    Images that are already small enough keep their size.
+
+    Args:
+        path: Source image file
+        height: Height the image will be shown at, in scene units
+
+    Returns:
+        Memory-mapped (height, width, 4) uint8 array
+    """
+    with Image.open(path) as image:
+        size = scaled_size(image.size, height)
+
+    def decode():
+        with Image.open(path) as image:
+            return to_rgba(image, size)
+
+    return cached_array(f"{file_hash(path)[:20]}_{size[0]}x{size[1]}", decode)
+
+
+class MappedImageMobject(ImageMobject):
+    """ImageMobject that keeps the given RGBA array instead of copying it
+
+    ImageMobject copies any array it is given; this keeps memory-mapped
+    arrays mapped, so the decoded pages are shared between processes.
+    """
+
+    def __init__(self, pixel_array: np.ndarray, **kwargs):
+        super().__init__(np.zeros((1, 1, 4), dtype=np.uint8), **kwargs)
+        self.pixel_array = pixel_array
+        self.reset_points()
+
+
+def load_image(path: str, height: Optional[float] = None,
+               scale: float = 1.0) -> ImageMobject:
+    """Create an image mobject from the cached pixels for the current quality
+
+    Args:
+        path: Source image file
+        height: Height in scene units; None keeps ImageMobject's default size
+        scale: Extra factor applied to the default size when height is None
+
+    Returns:
+        Image mobject with the same on-screen size as ImageMobject(path)
+        scaled to `height` (or by `scale`)
+    """
+    if height is None:
+        height = natural_height(path) * scale
+    return image_from_pixels(decoded_image(path, height), height)
+
+
+def image_from_pixels(pixel_array: np.ndarray, height: float) -> ImageMobject:
+    """Image mobject `height` scene units tall showing an RGBA array (not copied)"""
+    image = MappedImageMobject(pixel_array)
+    image.height = height
+    return image
+
+
+# ============================================================================
+# ANIMATED GIFS
+# ============================================================================
+def gif_frames(path: str, height: float) -> np.ndarray:
+    """RGBA pixels of every frame of a GIF, scaled for the current quality
+
+    Frames are decoded in memory: PIL composites each frame in order, and
+    the RGBA conversion and scaling of the frames run on a thread pool.
+    Converted frames are written straight into the cache file a chunk at a
+    time, so memory use does not grow with the length of the GIF. The
+    result is cached by GIF content hash and target size; later renders
+    only map the cached file, and frames are paged in as they are shown.
+
+    Args:
+        path: GIF file
+        height: Height the frames will be shown at, in scene units
+
+    Returns:
+        Memory-mapped (frames, height, width, 4) uint8 array
+    """
+    with Image.open(path) as gif:
+        size = scaled_size(gif.size, height)
+        num_frames = getattr(gif, "n_frames", 1)
+
+    def write(tmp_path):
+        frames = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=np.uint8,
+            shape=(num_frames, size[1], size[0], 4)
+        )
+        workers = os.cpu_count() or 1
+        with Image.open(path) as gif, ThreadPoolExecutor(workers) as executor:
+            for start in range(0, num_frames, 2 * workers):
+                # Seeking composites each frame over the previous ones, so it stays in order
+                chunk = []
+                for index in range(start, min(start + 2 * workers, num_frames)):
+                    gif.seek(index)
+                    chunk.append(gif.copy())
+                for offset, pixels in enumerate(
+                        executor.map(lambda frame: to_rgba(frame, size), chunk)):
+                    frames[start + offset] = pixels
+        frames.flush()
+        del frames
+
+    return _cached_file(f"{file_hash(path)[:20]}_{size[0]}x{size[1]}_frames", write)
+
+
+def gif_frame_rate(path: str) -> Optional[float]:
+    """Playback rate of a GIF from its first frame's duration, if it has one"""
+    with Image.open(path) as gif:
+        duration = gif.info.get("duration")
+    return 1000 / duration if duration else None
+
+
+# ============================================================================
+# STREAMED MEDIA FRAMES
+# ============================================================================
+class MediaFrames:
+    """Frames of a GIF, video file or image folder, decoded on demand
+
+    Indexing returns the RGBA pixels of one frame. The most recently used
+    frames are kept in a small LRU, so memory stays flat however long the
+    source is. Copies of a mobject share the same MediaFrames.
+
+    Sources:
+        GIF: frames are mapped from the gif_frames() cache
+        Folder: each image is loaded through decoded_image() in generation order
+        Video: frames are streamed from an ffmpeg pipe (needs ffmpeg and
+            ffprobe), restarted with a seek when playback jumps
+    """
+
+    # Frames skipped by reading ahead before an ffmpeg seek is cheaper
+    MAX_VIDEO_SKIP = 60
+
+    def __init__(self, source: str, height: float, cache_size: int = 8):
+        """
+        Args:
+            source: GIF file, video file or folder of images
+            height: Height the frames will be shown at, in scene units
+            cache_size: Number of decoded frames kept in memory
+        """
+        self.source = source
+        self.height = height
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._process = None
+
+        if os.path.isdir(source):
+            self._files = [
+                os.path.join(source, name)
+                for name in sorted(os.listdir(source), key=generation_key)
+                if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+            ]
+            if not self._files:
+                raise FileNotFoundError(f"No images in {source}")
+            self.kind = "folder"
+            self.num_frames = len(self._files)
+            self.frame_rate = None
+        elif source.lower().endswith(".gif"):
+            self._gif = gif_frames(source, height)
+            self.kind = "gif"
+            self.num_frames = len(self._gif)
+            self.frame_rate = gif_frame_rate(source)
+        else:
+            self.kind = "video"
+            self._probe_video()
+
+    def _probe_video(self):
+        if not (shutil.which("ffmpeg") and shutil.which("ffprobe")):
+            raise RuntimeError(f"Streaming {self.source} needs ffmpeg and ffprobe")
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "v:0",
+             "-show_entries",
+             "stream=width,height,avg_frame_rate,r_frame_rate,nb_frames:format=duration",
+             "-of", "json", self.source],
+            capture_output=True, text=True, check=True
+        )
+        info = json.loads(result.stdout)
+        stream = info["streams"][0]
+        # ffprobe reports an unknown average rate as 0/0: use the stream's base rate
+        for rate in (stream.get("avg_frame_rate", "0/0"), stream.get("r_frame_rate", "0/0")):
+            numerator, denominator = (int(x) for x in rate.split("/"))
+            if numerator > 0 and denominator > 0:
+                self.frame_rate = numerator / denominator
+                break
+        else:
+            raise RuntimeError(f"ffprobe reports no frame rate for {self.source}")
+        self.size = scaled_size((stream["width"], stream["height"]), self.height)
+        if str(stream.get("nb_frames", "")).isdigit():
+            self.num_frames = int(stream["nb_frames"])
+        else:
+            self.num_frames = int(float(info["format"]["duration"]) * self.frame_rate)
+        self._next_index = 0
+
+    def __len__(self) -> int:
+        return self.num_frames
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+
+        if self.kind == "gif":
+            pixels = self._gif[index]
+        elif self.kind == "folder":
+            pixels = decoded_image(self._files[index], self.height)
+        else:
+            pixels = self._read_video_frame(index)
+
+        self._cache[index] = pixels
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return pixels
+
+    def _read_video_frame(self, index: int) -> np.ndarray:
+        if (self._process is None or index < self._next_index
+                or index - self._next_index > self.MAX_VIDEO_SKIP):
+            self._start_video(index)
+        width, height = self.size
+        while True:
+            pixels = np.empty((height, width, 4), dtype=np.uint8)
+            if self._process.stdout.readinto(memoryview(pixels).cast("B")) < pixels.nbytes:
+                raise IndexError(f"Frame {index} is past the end of {self.source}")
+            self._next_index += 1
+            if self._next_index > index:
+                return pixels
+
+    def _start_video(self, index: int):
+        self.close()
+        width, height = self.size
+        self._process = subprocess.Popen(
+            ["ffmpeg", "-v", "error", "-ss", f"{index / self.frame_rate:.6f}",
+             "-i", self.source, "-vf", f"scale={width}:{height}:flags=lanczos",
+             "-f", "rawvideo", "-pix_fmt", "rgba", "-"],
+            stdout=subprocess.PIPE, stdin=subprocess.DEVNULL
+        )
+        self._next_index = index
+
+    def close(self):
+        """Stop the video decoder, if one is running"""
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def __deepcopy__(self, memo) -> "MediaFrames":
+        # Mobject.copy() deep-copies; copies share the decoder and the LRU
+        return self
+
+
+# ============================================================================
+# BACKGROUND PREFETCH
+# ============================================================================
+class ImagePrefetcher:
+    """Decodes the images of upcoming steps on background threads
+
+    Images are grouped in steps (e.g. one generation of several sequences).
+    Asking for an image of step i queues the decoding of steps i+1 to
+    i+lookahead, so it overlaps with the rendering of step i. Only the
+    current step and the look-ahead window are held in memory.
+
+    Call close() (or use it as a context manager) to stop the threads:
+
+        with ImagePrefetcher(steps, height=3.6) as images:
+            for step in range(len(steps)):
+                img = images.get(step, 0)
+    """
+
+    def __init__(self, steps: Sequence[Sequence[Optional[str]]], height: float,
+                 lookahead: int = 1, workers: int = 3):
+        """
+        Args:
+            steps: Image paths of each step (None for a missing image)
+            height: Height the images are shown at, in scene units
+            lookahead: Number of steps decoded ahead of the current one
+            workers: Number of decoding threads
+        """
+        self.steps = steps
+        self.height = height
+        self.lookahead = lookahead
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="image-prefetch"
+        )
+        self._pending = {}
+
+    def _submit(self, step: int):
+        if step >= len(self.steps) or step in self._pending:
+            return
+        self._pending[step] = [
+            self._executor.submit(decoded_image, path, self.height)
+            if path is not None else None
+            for path in self.steps[step]
+        ]
+
+    def get_pixels(self, step: int, index: int) -> np.ndarray:
+        """RGBA pixels of image `index` of `step`, waiting for its decoding if needed
+
+        Raises:
+            Any error raised while decoding the image
+        """
+        # Release steps that have been passed and queue the window ahead
+        for passed in [s for s in self._pending if s < step]:
+            del self._pending[passed]
+        for ahead in range(step, step + self.lookahead + 1):
+            self._submit(ahead)
+
+        future = self._pending[step][index]
+        if future is None:
+            raise FileNotFoundError(f"No image for step {step}, index {index}")
+        return future.result()
+
+    def get(self, step: int, index: int) -> ImageMobject:
+        """Image mobject of image `index` of `step` (see get_pixels)"""
+        return image_from_pixels(self.get_pixels(step, index), self.height)
+
+    def close(self):
+        self._pending.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ImagePrefetcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -4,14 +4,18 @@ Elegant display of Cultural Alien Sampler image sequences
 """
 
 from manim import *
-import os
-import glob
 
+from scenes.assets import ImagePrefetcher, load_image
+from scenes.camera import CASScene
+from scenes.catalog import sequence, sequence_folders
+from scenes.mobjects import Crossfade, CrossfadeImage
+from scenes.texts import cached_text
 
-class CAMShowcase(Scene):
+
+class CAMShowcase(CASScene):
     def construct(self):
         # Title with elegant typography
-        title = Text(
+        title = cached_text(
             "CAM Examples",
             font_size=52,
             weight=BOLD,
@@ -24,26 +28,11 @@ class CAMShowcase(Scene):
         )
         self.wait(0.5)
         
-        # Get all image folders
-        images_path = "images"
-        
-        # Check if directory exists
-        if not os.path.exists(images_path):
-            error_text = Text(
-                "Images folder not found",
-                font_size=32,
-                color=RED
-            )
-            self.play(Write(error_text))
-            self.wait(2)
-            return
-        
-        # Get folders (each represents a concept combination)
-        folders = [f for f in os.listdir(images_path) 
-                  if os.path.isdir(os.path.join(images_path, f))]
+        # Get folders from the asset catalog (each represents a concept combination)
+        folders = sequence_folders()
         
         if not folders:
-            error_text = Text(
+            error_text = cached_text(
                 "No image sequences found",
                 font_size=32,
                 color=RED
@@ -60,9 +49,9 @@ class CAMShowcase(Scene):
                 break
         
         if target_folder:
-            folder_path = os.path.join(images_path, target_folder)
-            image_files = sorted(glob.glob(os.path.join(folder_path, "*.png")))
-            concepts = self.parse_concepts(target_folder)
+            target_sequence = sequence(target_folder)
+            image_files = [image['path'] for image in target_sequence['images']]
+            concepts = target_sequence['concepts']
             
             # Fade out title before showing images
             self.play(
@@ -94,27 +83,7 @@ class CAMShowcase(Scene):
             ordered_folders = other_folders[:3]
         
         if len(ordered_folders) >= 3:
-            self.show_three_sequences_parallel(ordered_folders, images_path)
-    
-    def parse_concepts(self, folder_name):
-        """Extract concepts from folder name"""
-        # Replace underscores and hyphens with spaces, split by common separators
-        concepts = folder_name.replace('_', ' ').replace('-', ' ')
-        # Capitalize each word
-        concepts = concepts.title()
-        
-        # Handle special multi-word concepts
-        if "Abstract Expressionism" in concepts:
-            # Keep "Abstract Expressionism" as one concept
-            other_parts = concepts.replace("Abstract Expressionism", "").strip()
-            words = ["Abstract Expressionism"]
-            if other_parts:
-                words.extend(other_parts.split())
-        else:
-            # Split into individual concepts
-            words = concepts.split()
-        
-        return words
+            self.show_three_sequences_parallel(ordered_folders)
     
     def show_sequence_fullscreen(self, concepts, image_files):
         """Display a single sequence in fullscreen with concepts"""
@@ -138,74 +107,76 @@ class CAMShowcase(Scene):
         # Display images in sequence
         num_images = min(len(image_files), 8)
         
-        for img_idx in range(num_images):
-            try:
-                # Load image
-                img = ImageMobject(image_files[img_idx])
-                img.height = 5
-                img.move_to(ORIGIN)
-                
-                # Add generation label
-                gen_label = Text(
-                    f"Generation {img_idx + 1}",
-                    font_size=28,
-                    color=YELLOW,
-                    weight=BOLD
-                ).to_edge(DOWN, buff=0.5)
-                
-                # Add elegant frame
-                frame = SurroundingRectangle(
-                    img,
-                    color=WHITE,
-                    stroke_width=3,
-                    buff=0.15,
-                    corner_radius=0.1
-                )
-                
-                if img_idx == 0:
-                    # First image: fade in
-                    self.play(
-                        FadeIn(img, scale=0.95),
-                        Create(frame),
-                        Write(gen_label),
-                        run_time=1
-                    )
-                else:
-                    # Subsequent images: crossfade
-                    old_img = self.mobjects[-3]
-                    old_frame = self.mobjects[-2]
-                    old_label = self.mobjects[-1]
+        # Decode the next generation while the current one renders
+        with ImagePrefetcher(
+            [[path] for path in image_files[:num_images]], height=5
+        ) as prefetcher:
+            # One image mobject crossfades through the generations
+            img = None
+            gen_label = None
+            
+            for img_idx in range(num_images):
+                try:
+                    # Load image
+                    pixels = prefetcher.get_pixels(img_idx, 0)
                     
-                    self.play(
-                        FadeOut(old_img),
-                        FadeOut(old_frame),
-                        FadeOut(old_label),
-                        FadeIn(img, scale=0.95),
-                        Create(frame),
-                        Write(gen_label),
-                        run_time=0.8
-                    )
-                
-                self.wait(0.6)
-                
-            except Exception as e:
-                print(f"Error loading image {image_files[img_idx]}: {e}")
-                continue
+                    # Add generation label
+                    new_label = cached_text(
+                        f"Generation {img_idx + 1}",
+                        font_size=28,
+                        color=YELLOW,
+                        weight=BOLD
+                    ).to_edge(DOWN, buff=0.5)
+                    
+                    if img is None:
+                        # First image: fade in
+                        img = CrossfadeImage(pixels)
+                        img.height = 5
+                        img.move_to(ORIGIN)
+                        
+                        # Add elegant frame
+                        frame = SurroundingRectangle(
+                            img,
+                            color=WHITE,
+                            stroke_width=3,
+                            buff=0.15,
+                            corner_radius=0.1
+                        )
+                        
+                        self.play(
+                            FadeIn(img, scale=0.95),
+                            Create(frame),
+                            Write(new_label),
+                            run_time=1
+                        )
+                    else:
+                        # Subsequent images: crossfade inside the same frame
+                        self.play(
+                            Crossfade(img, pixels),
+                            FadeOut(gen_label),
+                            Write(new_label),
+                            run_time=0.8
+                        )
+                    
+                    gen_label = new_label
+                    self.wait(0.6)
+                    
+                except Exception as e:
+                    print(f"Error loading image {image_files[img_idx]}: {e}")
+                    continue
         
         self.wait(0.3)
     
-    def show_three_sequences_parallel(self, folders, images_path):
+    def show_three_sequences_parallel(self, folders):
         """Show three sequences evolving side by side"""
         
         # Load all three sequences
         sequences_data = []
         for folder in folders:
-            folder_path = os.path.join(images_path, folder)
-            image_files = sorted(glob.glob(os.path.join(folder_path, "*.png")))
-            concepts = self.parse_concepts(folder)
+            folder_sequence = sequence(folder)
             sequences_data.append({
-                'concepts': concepts,
-                'images': image_files
+                'concepts': folder_sequence['concepts'],
+                'images': [image['path'] for image in folder_sequence['images']]
             })
         
         if len(sequences_data) < 3:
@@ -235,69 +206,70 @@ class CAMShowcase(Scene):
         # Determine maximum number of generations
         max_gens = max(min(len(seq['images']), 8) for seq in sequences_data)
         
-        # Show images evolving in parallel
-        current_mobjects = [None, None, None]  # Track current image groups
-        
-        for gen_idx in range(max_gens):
-            new_mobjects = []
-            animations = []
+        # Decode the next generation of all sequences while the current one renders
+        with ImagePrefetcher(
+            [
+                [seq['images'][gen_idx] if gen_idx < len(seq['images']) else None
+                 for seq in sequences_data]
+                for gen_idx in range(max_gens)
+            ],
+            height=3.6
+        ) as prefetcher:
+            # Show images evolving in parallel, one crossfading image per sequence
+            columns = [None, None, None]  # (image, label) of each sequence
             
-            for seq_idx, (seq_data, pos) in enumerate(zip(sequences_data, positions)):
-                if gen_idx < len(seq_data['images']):
+            for gen_idx in range(max_gens):
+                animations = []
+                
+                for seq_idx, (seq_data, pos) in enumerate(zip(sequences_data, positions)):
+                    if gen_idx >= len(seq_data['images']):
+                        continue
                     try:
                         # Load image
-                        img = ImageMobject(seq_data['images'][gen_idx])
-                        img.height = 3.6
-                        img.move_to(pos + DOWN * 0.3)
+                        pixels = prefetcher.get_pixels(gen_idx, seq_idx)
                         
-                        # Frame
-                        frame = SurroundingRectangle(
-                            img,
-                            color=WHITE,
-                            stroke_width=2,
-                            buff=0.1,
-                            corner_radius=0.08
-                        )
+                        if columns[seq_idx] is None:
+                            img = CrossfadeImage(pixels)
+                            img.height = 3.6
+                            img.move_to(pos + DOWN * 0.3)
+                            
+                            # Frame
+                            frame = SurroundingRectangle(
+                                img,
+                                color=WHITE,
+                                stroke_width=2,
+                                buff=0.1,
+                                corner_radius=0.08
+                            )
+                            
+                            # First image: fade in
+                            animations.extend([
+                                FadeIn(img, scale=0.9),
+                                Create(frame)
+                            ])
+                        else:
+                            # Crossfade inside the same frame
+                            img, old_label = columns[seq_idx]
+                            animations.append(Crossfade(img, pixels))
+                            animations.append(FadeOut(old_label))
                         
                         # Generation label
-                        label = Text(
+                        label = cached_text(
                             f"Gen {gen_idx + 1}",
                             font_size=18,
                             color=YELLOW
                         ).next_to(img, DOWN, buff=0.15)
+                        animations.append(Write(label))
                         
-                        img_group = Group(img, frame, label)
-                        new_mobjects.append(img_group)
-                        
-                        # Create animations
-                        if current_mobjects[seq_idx] is None:
-                            # First image: fade in
-                            animations.extend([
-                                FadeIn(img, scale=0.9),
-                                Create(frame),
-                                Write(label)
-                            ])
-                        else:
-                            # Crossfade
-                            animations.extend([
-                                FadeOut(current_mobjects[seq_idx]),
-                                FadeIn(img, scale=0.9),
-                                Create(frame),
-                                Write(label)
-                            ])
+                        columns[seq_idx] = (img, label)
                         
                     except Exception as e:
                         print(f"Error loading image: {e}")
-                        new_mobjects.append(None)
-                else:
-                    new_mobjects.append(None)
-            
-            # Play all animations simultaneously
-            if animations:
-                self.play(*animations, run_time=0.9)
-                self.wait(1)
-            
-            current_mobjects = new_mobjects
+                
+                # Play all animations simultaneously
+                if animations:
+                    self.play(*animations, run_time=0.9)
+                    self.wait(1)
         
         self.wait(2)
     
@@ -311,7 +283,7 @@ class CAMShowcase(Scene):
             color = colors[i % len(colors)]
             
             # Create text
-            text = Text(
+            text = cached_text(
                 concept,
                 font_size=22,
                 color=color,
@@ -335,12 +307,12 @@ class CAMShowcase(Scene):
         return tags
 
 
-class CAMShowcaseGrid(Scene):
+class CAMShowcaseGrid(CASScene):
     """Alternative: Show multiple generations in a grid layout"""
     
     def construct(self):
         # Title
-        title = Text(
+        title = cached_text(
             "Cultural Alien Sampler: Evolution Grid",
             font_size=48,
             weight=BOLD
@@ -349,30 +321,19 @@ class CAMShowcaseGrid(Scene):
         self.play(Write(title), run_time=1)
         self.wait(0.5)
         
-        # Get images
-        images_path = "/mnt/user-data/uploads/images"
-        
-        if not os.path.exists(images_path):
-            return
-        
-        folders = [f for f in os.listdir(images_path) 
-                  if os.path.isdir(os.path.join(images_path, f))]
+        # Get images from the asset catalog
+        folders = sequence_folders()
         
         if not folders:
             return
         
         # Take first folder as example
-        folder_path = os.path.join(images_path, folders[0])
-        image_files = sorted(glob.glob(os.path.join(folder_path, "*.png")))[:6]
-        
-        if not image_files:
-            return
-        
-        # Parse concepts
-        concepts = folders[0].replace('_', ' ').replace('-', ' ').title().split()
+        folder_sequence = sequence(folders[0])
+        image_files = [image['path'] for image in folder_sequence['images']][:6]
+        concepts = folder_sequence['concepts']
         
         # Display concepts
-        concept_display = Text(
+        concept_display = cached_text(
             "Input: " + " + ".join(concepts),
             font_size=28,
             color=YELLOW
@@ -381,13 +342,12 @@ class CAMShowcaseGrid(Scene):
         self.play(FadeIn(concept_display), run_time=0.8)
         self.wait(0.5)
         
-        # Create grid of images
-        grid_group = VGroup()
+        # Create grid of images (Group, since the items hold images)
+        grid_group = Group()
         
         for i, img_path in enumerate(image_files):
             try:
-                img = ImageMobject(img_path)
-                img.height = 1.8
+                img = load_image(img_path, height=1.8)
                 
                 # Frame
                 frame = SurroundingRectangle(
@@ -399,7 +359,7 @@ class CAMShowcaseGrid(Scene):
                 )
                 
                 # Label
-                label = Text(
+                label = cached_text(
                     f"Gen {i+1}",
                     font_size=16,
                     color=GREY
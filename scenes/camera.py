@@ -0,0 +1,579 @@
+"""
+Camera and scene base class for the custom mobjects of scenes/mobjects.py
+
+CASCamera draws the batched mobjects (such as PointCloud) with vectorized
+NumPy rasterizers, in z-order with everything else, and blooms the mobjects
+marked with bloom(). VMobjects whose shape stays the same from frame to
+frame (fading or sliding text and boxes) are rasterized once into sprites,
+and images that stay in place are resampled once instead of every frame.
+Scenes that use them derive from CASScene instead of Scene.
+"""
+
+import hashlib
+import itertools
+import weakref
+import zlib
+from collections import OrderedDict
+
+import cairo
+from manim import *
+import numpy as np
+from PIL import Image
+from scipy.spatial.distance import pdist
+
+from scenes.mobjects import LineCollection, PointCloud
+
+
+def bloom(mobject: Mobject, radius: float = 0.05, strength: float = 1.0,
+          threshold: float = 0.0, glow_only: bool = False) -> Mobject:
+    """
+    Mark a mobject (and its family) to glow when drawn by CASCamera
+
+    Instead of stacking thick translucent copies of a stroke, the marked
+    mobjects are drawn into a separate layer that is blurred and added to
+    the frame beneath them: one blur per frame however many mobjects glow.
+
+        lines = bloom(LineCollection(starts, ends, widths=2), radius=0.04)
+
+    Args:
+        mobject: Mobject to mark
+        radius: Spread of the glow (Gaussian sigma) in scene units
+        strength: Multiplier of the blurred light added to the frame
+        threshold: Only pixels of the layer at least this bright (luminance
+            in [0, 1]) glow
+        glow_only: Use the mobject only as a light source: its glow is
+            added, but the mobject itself is not drawn
+
+    Returns:
+        The mobject
+    """
+    for member in mobject.get_family():
+        member.bloom = (radius, strength, threshold, glow_only)
+    return mobject
+
+
+def _box_blur(image: np.ndarray, radius: int, axis: int) -> np.ndarray:
+    """Mean over a window of 2 * radius + 1 pixels along an axis, zero outside"""
+    pad = [(0, 0)] * image.ndim
+    pad[axis] = (radius + 1, radius)
+    sums = np.cumsum(np.pad(image, pad), axis=axis, dtype=np.float32)
+    size = image.shape[axis]
+    window = 2 * radius + 1
+    upper = [slice(None)] * image.ndim
+    upper[axis] = slice(window, window + size)
+    lower = [slice(None)] * image.ndim
+    lower[axis] = slice(0, size)
+    blurred = sums[tuple(upper)] - sums[tuple(lower)]
+    blurred /= window
+    return blurred
+
+
+def _resize_linear(image: np.ndarray, size: int, step: int, axis: int) -> np.ndarray:
+    """Upsample an axis by `step` with linear interpolation, to `size` pixels"""
+    coords = np.clip((np.arange(size) + 0.5) / step - 0.5, 0, image.shape[axis] - 1)
+    low = np.floor(coords).astype(int)
+    high = np.minimum(low + 1, image.shape[axis] - 1)
+    shape = [1] * image.ndim
+    shape[axis] = size
+    weight = (coords - low).astype(np.float32).reshape(shape)
+    return np.take(image, low, axis=axis) * (1 - weight) + np.take(image, high, axis=axis) * weight
+
+
+def bloom_light(layer: np.ndarray, sigma: float, threshold: float = 0.0) -> np.ndarray:
+    """
+    Blurred RGB light of a premultiplied RGBA layer
+
+    Pixels darker than the threshold are dropped, then the layer is blurred
+    at a reduced resolution (so the blur keeps a few pixels of sigma) with
+    three box blurs per axis, which approximate a Gaussian, and resized back.
+
+    Args:
+        layer: (h, w, 4) uint8 layer
+        sigma: Blur sigma in pixels
+        threshold: Minimum luminance in [0, 1] of the pixels that glow
+
+    Returns:
+        (h, w, 3) float32 light, in pixel value units
+    """
+    height, width = layer.shape[:2]
+    source = layer[..., :3].astype(np.float32)
+    if threshold > 0:
+        luminance = source @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32) / 255
+        source *= (luminance >= threshold)[..., None]
+
+    # Average step x step blocks, so the blur works on fewer pixels
+    step = max(1, int(sigma / 2))
+    if step > 1:
+        padded = np.pad(source, [(0, -height % step), (0, -width % step), (0, 0)])
+        source = sum(padded[i::step, j::step] for i in range(step) for j in range(step))
+        source /= step * step
+
+    # Three box passes of this width have the variance of the Gaussian
+    box_radius = max(1, round((np.sqrt(4 * (sigma / step) ** 2 + 1) - 1) / 2))
+    for axis in (0, 1):
+        for _ in range(3):
+            source = _box_blur(source, box_radius, axis)
+
+    if step > 1:
+        source = _resize_linear(source, height, step, 0)
+        source = _resize_linear(source, width, step, 1)
+    return source
+
+
+class CASCamera(Camera):
+    """Camera that also draws the batched mobjects of scenes/mobjects.py"""
+
+    # Points rasterized per chunk, to bound the size of the fragment arrays
+    POINT_CHUNK = 1 << 15
+
+    # Sprite positions are rounded to this fraction of a pixel
+    SPRITE_SUBPIXELS = 4
+    # Memory kept for sprites, least recently used dropped first
+    SPRITE_CACHE_BYTES = 1 << 28
+    # Shapes remembered to recognize a VMobject drawn again unchanged (whose sprites are kept)
+    SEEN_SHAPES = 1 << 14
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sprites = OrderedDict()
+        self._sprite_bytes = 0
+        self._seen_shapes = OrderedDict()
+        # Last resampled image of each ImageMobject, dropped with the mobject
+        self._resampled = weakref.WeakKeyDictionary()
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        # Consecutive mobjects sharing bloom settings are drawn as one layer
+        for settings, layer in itertools.groupby(mobjects, lambda mob: getattr(mob, "bloom", None)):
+            if settings is None:
+                self.display_mobjects(list(layer), self.pixel_array)
+            else:
+                self.display_bloom_layer(list(layer), settings, self.pixel_array)
+
+    def display_mobjects(self, mobjects, pixel_array: np.ndarray):
+        for group_type, group in itertools.groupby(mobjects, self.type_or_raise):
+            self.display_funcs[group_type](list(group), pixel_array)
+
+    def display_bloom_layer(self, mobjects, settings, pixel_array: np.ndarray):
+        """
+        Draw mobjects into a separate layer, add its blurred light to the
+        frame, then composite the layer over it
+
+        Only the rows and columns the layer (and its glow) reach are blended.
+        """
+        radius, strength, threshold, glow_only = settings
+        # One layer buffer per camera, so cairo reuses its context
+        layer = getattr(self, "_bloom_layer", None)
+        if layer is None or layer.shape != pixel_array.shape:
+            layer = self._bloom_layer = np.zeros_like(pixel_array)
+        else:
+            layer[:] = 0
+        self.display_mobjects(mobjects, layer)
+
+        alpha = layer[..., 3]
+        rows = np.flatnonzero(alpha.any(axis=1))
+        columns = np.flatnonzero(alpha.any(axis=0))
+        if len(rows) == 0:
+            return
+        sigma = radius * (self.pixel_height / self.frame_height)
+        reach = int(np.ceil(3 * sigma)) + 2
+        window = (
+            slice(max(rows[0] - reach, 0), rows[-1] + reach + 1),
+            slice(max(columns[0] - reach, 0), columns[-1] + reach + 1)
+        )
+
+        frame = pixel_array[window].astype(np.float32)
+        frame[..., :3] += strength * bloom_light(layer[window], sigma, threshold)
+        if not glow_only:
+            # "Over" with the premultiplied layer
+            source = layer[window].astype(np.float32)
+            frame *= 1 - source[..., 3:] / self.rgb_max_val
+            frame += source
+        pixel_array[window] = np.clip(frame, 0, self.rgb_max_val).astype(pixel_array.dtype)
+
+    def type_or_raise(self, mobject: Mobject):
+        # Camera.type_or_raise rebuilds display_funcs, so the custom types are added after it
+        mobject_type = super().type_or_raise(mobject)
+        self.display_funcs[PointCloud] = self.display_multiple_point_clouds
+        self.display_funcs[LineCollection] = self.display_multiple_line_collections
+        for batched_type in (PointCloud, LineCollection):
+            if isinstance(mobject, batched_type):
+                return batched_type
+        return mobject_type
+
+    def to_pixel_space(self, points: np.ndarray) -> np.ndarray:
+        """(n, 2) floating-point pixel coordinates (x right, y down) of points"""
+        shifted = points[:, :2] - self.frame_center[:2]
+        return np.column_stack([
+            shifted[:, 0] * (self.pixel_width / self.frame_width) + self.pixel_width / 2,
+            shifted[:, 1] * -(self.pixel_height / self.frame_height) + self.pixel_height / 2
+        ])
+
+    def display_multiple_point_clouds(self, clouds, pixel_array: np.ndarray):
+        for cloud in clouds:
+            self.display_point_cloud_arrays(
+                self.to_pixel_space(cloud.points),
+                cloud.radii * (self.pixel_height / self.frame_height),
+                cloud.rgbas,
+                pixel_array
+            )
+
+    def display_point_cloud_arrays(self, centers: np.ndarray, radii: np.ndarray,
+                                   rgbas: np.ndarray, pixel_array: np.ndarray):
+        """
+        Draw antialiased discs, every disc of a chunk in one vectorized pass
+
+        Each disc covers the pixels of a square around its center; a
+        pixel's alpha is its coverage (1 inside, fading over the last pixel
+        of the edge) times the point's opacity. Where discs overlap, every
+        disc is blended "over" the ones drawn before it, in point order.
+
+        Args:
+            centers: (n, 2) pixel coordinates
+            radii: (n,) radii in pixels
+            rgbas: (n, 4) colors with opacity, in [0, 1]
+            pixel_array: Frame to draw into
+        """
+        if len(centers) == 0:
+            return
+        height, width = pixel_array.shape[:2]
+        # One uint32 per RGBA pixel, so gathering and scattering move whole pixels
+        pixels = pixel_array.reshape(-1).view(np.uint32)
+        colors = rgbas.astype(np.float32) * self.rgb_max_val
+        colors[:, 3] = self.rgb_max_val
+
+        # Pixel offsets (from the pixel holding the center) the largest disc can touch
+        reach = int(np.ceil(radii.max() + 0.5))
+        offsets = np.arange(-reach, reach + 1)
+        off_x, off_y = [grid.ravel() for grid in np.meshgrid(offsets, offsets)]
+        nearest = np.hypot(np.maximum(np.abs(off_x) - 0.5, 0), np.maximum(np.abs(off_y) - 0.5, 0))
+        touched = nearest < radii.max() + 0.5
+        off_x, off_y = off_x[touched], off_y[touched]
+
+        centers = centers.astype(np.float32)
+        radii = radii.astype(np.float32)
+        for start in range(0, len(centers), self.POINT_CHUNK):
+            chunk = slice(start, start + self.POINT_CHUNK)
+            base = np.floor(centers[chunk]).astype(np.int32)
+            px = base[:, :1] + off_x.astype(np.int32)
+            py = base[:, 1:] + off_y.astype(np.int32)
+            # Offset of each pixel center from the disc center
+            dx = (base[:, :1] - centers[chunk, :1] + 0.5) + off_x.astype(np.float32)
+            dy = (base[:, 1:] - centers[chunk, 1:] + 0.5) + off_y.astype(np.float32)
+            distance = np.sqrt(dx * dx + dy * dy)
+            alpha = np.clip(radii[chunk, None] + 0.5 - distance, 0, 1)
+            alpha *= rgbas[chunk, 3:].astype(np.float32)
+
+            visible = (alpha > 0) & (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            point_index = np.nonzero(visible)[0]
+            pixel_index = (py * width + px)[visible]
+            alpha = alpha[visible]
+            if len(pixel_index) == 0:
+                continue
+
+            # Group the fragments of each pixel, keeping them in draw order
+            order = np.argsort(pixel_index, kind="stable")
+            pixel_index = pixel_index[order]
+            point_index = point_index[order]
+            alpha = alpha[order].astype(np.float64)
+            first = np.flatnonzero(np.r_[True, pixel_index[1:] != pixel_index[:-1]])
+            last = np.r_[first[1:], len(pixel_index)] - 1
+            group = np.repeat(np.arange(len(first)), np.diff(np.r_[first, len(pixel_index)]))
+
+            # Drawing fragments 1..k "over" d in turn gives
+            # d * prod(1 - a_i) + sum(c_i * a_i * prod(1 - a_j) for j > i);
+            # the products are sums of logs (opaque fragments clipped just below 1)
+            log_clear = np.log1p(-np.minimum(alpha, 1 - 1e-7))
+            total = np.cumsum(log_clear)
+            covered_after = total[last][group] - total
+            weight = (alpha * np.exp(covered_after)).astype(np.float32)
+            source = np.add.reduceat(colors[start + point_index] * weight[:, None], first)
+            clear = np.exp(np.add.reduceat(log_clear, first)).astype(np.float32)
+
+            # The source alpha channel is opaque, so alpha blends toward full
+            targets = pixel_index[first]
+            destination = pixels[targets].view(np.uint8).reshape(-1, 4).astype(np.float32)
+            destination = destination * clear[:, None] + source
+            pixels[targets] = destination.astype(np.uint8).view(np.uint32).ravel()
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array: np.ndarray):
+        ctx = self.get_cairo_context(pixel_array)
+        for vmobject in vmobjects:
+            if not self.display_sprites(vmobject, ctx, pixel_array):
+                self.display_vectorized(vmobject, ctx)
+
+    def _sprite_parts(self, vmobject: VMobject):
+        """
+        (part, rgb, stroke width, opacity) of the fill and stroke to draw,
+        or None when a sprite cannot reproduce them (gradients, background
+        stroke)
+        """
+        background = self.get_stroke_rgbas(vmobject, background=True)
+        if vmobject.get_stroke_width(background=True) > 0 and (background[:, 3] > 0).any():
+            return None
+        parts = []
+        fill = self.get_fill_rgbas(vmobject)
+        if (fill[:, 3] > 0).any():
+            if (fill != fill[0]).any():
+                return None
+            parts.append(("fill", tuple(fill[0, :3]), 0.0, fill[0, 3]))
+        stroke = self.get_stroke_rgbas(vmobject)
+        width = vmobject.get_stroke_width()
+        if width > 0 and (stroke[:, 3] > 0).any():
+            if (stroke != stroke[0]).any():
+                return None
+            parts.append(("stroke", tuple(stroke[0, :3]), width, stroke[0, 3]))
+        return parts
+
+    def display_sprites(self, vmobject: VMobject, ctx, pixel_array: np.ndarray) -> bool:
+        """
+        Draw a VMobject from sprites of its fill and stroke
+
+        The fill and the stroke each have a sprite rasterized by cairo at
+        full opacity, composited with the current opacity at the current
+        position (to 1/SPRITE_SUBPIXELS of a pixel), which is how cairo
+        would have blended them. Every VMobject whose style sprites can
+        reproduce is drawn this way, so a frame's pixels do not depend on
+        which frames this camera drew before (split and partial renders
+        match a full one).
+
+        Sprites are keyed by the shape, the VMobject's points relative to
+        its first point, so a copy that only moved or changed opacity (as
+        in FadeIn, FadeOut or a shift) reuses them. They are only kept once
+        a shape is drawn a second time: shapes that change every frame, as
+        in Write or Transform, never fill the cache.
+
+        Returns:
+            False if the VMobject has to be drawn with cairo: a style
+            sprites cannot reproduce
+        """
+        points = vmobject.points
+        if len(points) == 0:
+            return False
+        parts = self._sprite_parts(vmobject)
+        if not parts:
+            return False
+
+        shape = np.round(points - points[0], 6)
+        digest = hashlib.blake2b(shape.tobytes(), digest_size=16).digest()
+        # Shapes (or colors and widths) that change every frame, as in Write or
+        # Transform, never reach the sprite cache
+        seen = (digest, tuple((part, rgb, width) for part, rgb, width, _ in parts))
+        keep = seen in self._seen_shapes
+        if keep:
+            self._seen_shapes.move_to_end(seen)
+        else:
+            self._seen_shapes[seen] = True
+            if len(self._seen_shapes) > self.SEEN_SHAPES:
+                self._seen_shapes.popitem(last=False)
+
+        anchor = np.round(self.to_pixel_space(points[:1])[0] * self.SPRITE_SUBPIXELS).astype(int)
+        whole, fraction = np.divmod(anchor, self.SPRITE_SUBPIXELS)
+
+        # cairo may hold drawing in flight; the sprites are blended into its memory directly
+        surface = ctx.get_target()
+        surface.flush()
+        for part, rgb, width, opacity in parts:
+            key = (digest, part, rgb, width, tuple(fraction))
+            if key in self._sprites:
+                self._sprites.move_to_end(key)
+                sprite, left, top = self._sprites[key]
+            else:
+                sprite, left, top = self._render_sprite(vmobject, part, fraction)
+                if keep:
+                    self._cache_sprite(key, (sprite, left, top))
+            self.composite_sprite(sprite, whole[0] - left, whole[1] - top, opacity, pixel_array)
+        surface.mark_dirty()
+        return True
+
+    def _render_sprite(self, vmobject: VMobject, part: str, fraction: np.ndarray):
+        """
+        Rasterize the fill or the stroke of a VMobject at full opacity
+
+        Returns:
+            (sprite, left, top): a premultiplied RGBA array and the offset
+            of the pixel holding the first point from its top-left corner
+        """
+        reference = vmobject.copy()
+        if part == "fill":
+            reference.set_stroke(width=0).set_fill(opacity=1)
+            # Antialiasing spills into the neighbouring pixels
+            pad = 2
+        else:
+            reference.set_fill(opacity=0).set_stroke(opacity=1)
+            # Miter joins reach up to 5 line widths beyond a corner
+            line_width = reference.get_stroke_width() * self.cairo_line_width_multiple
+            pad = int(np.ceil(5 * line_width * self.pixel_height / self.frame_height)) + 2
+
+        scale = np.array([self.pixel_width / self.frame_width, -self.pixel_height / self.frame_height])
+        origin = reference.points[0]
+        offsets = (reference.points[:, :2] - origin[:2]) * scale
+        left = int(np.ceil(-offsets[:, 0].min())) + pad
+        top = int(np.ceil(-offsets[:, 1].min())) + pad
+        width = left + int(np.ceil(offsets[:, 0].max())) + pad + 1
+        height = top + int(np.ceil(offsets[:, 1].max())) + pad + 1
+
+        sprite = np.zeros((height, width, 4), dtype=np.uint8)
+        surface = cairo.ImageSurface.create_for_data(sprite.data, cairo.FORMAT_ARGB32, width, height)
+        ctx = cairo.Context(surface)
+        # The camera's frame-to-pixel transform, moved so the first point lands at (left, top)
+        anchor_x = left + fraction[0] / self.SPRITE_SUBPIXELS
+        anchor_y = top + fraction[1] / self.SPRITE_SUBPIXELS
+        ctx.set_matrix(cairo.Matrix(
+            scale[0], 0, 0, scale[1],
+            anchor_x - scale[0] * origin[0],
+            anchor_y - scale[1] * origin[1]
+        ))
+        self.display_vectorized(reference, ctx)
+        surface.finish()
+        return sprite, left, top
+
+    def _cache_sprite(self, key, entry):
+        self._sprites[key] = entry
+        self._sprite_bytes += entry[0].nbytes
+        while self._sprite_bytes > self.SPRITE_CACHE_BYTES and len(self._sprites) > 1:
+            _, (sprite, _, _) = self._sprites.popitem(last=False)
+            self._sprite_bytes -= sprite.nbytes
+
+    def composite_sprite(self, sprite: np.ndarray, left: int, top: int, opacity: float,
+                         pixel_array: np.ndarray):
+        """Blend a premultiplied sprite over the frame ("over", scaled by opacity)"""
+        height, width = sprite.shape[:2]
+        x0, y0 = max(left, 0), max(top, 0)
+        x1 = min(left + width, pixel_array.shape[1])
+        y1 = min(top + height, pixel_array.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        source = sprite[y0 - top:y1 - top, x0 - left:x1 - left].astype(np.float32)
+        source *= opacity
+        region = pixel_array[y0:y1, x0:x1]
+        blended = region * (1 - source[..., 3:] / self.rgb_max_val) + source
+        region[:] = (blended + 0.5).astype(pixel_array.dtype)
+
+    def resampled_image(self, image_mobject: ImageMobject):
+        """
+        An ImageMobject's pixels resized (and rotated) to where it is on screen,
+        as Camera.display_image_mobject computes them
+
+        The result is kept per mobject and reused while the mobject's corners
+        land on the same pixels and its pixel array is the same array with
+        the same content (a checksum catches in-place edits such as
+        set_opacity or a crossfade), so an image sitting still is resampled
+        once instead of every frame.
+
+        Returns:
+            (sub_image, left, top): the RGBA PIL image and the frame pixel of
+            its top-left corner
+        """
+        corner_coords = self.points_to_pixel_coords(image_mobject, image_mobject.points)
+        pixels = image_mobject.get_pixel_array()
+        placement = (corner_coords.tobytes(), image_mobject.resampling_algorithm)
+        checksum = zlib.crc32(np.ascontiguousarray(pixels))
+
+        cached = self._resampled.get(image_mobject)
+        if cached is not None:
+            cached_pixels, cached_checksum, cached_placement, resampled = cached
+            if (cached_pixels is pixels and cached_checksum == checksum
+                    and cached_placement == placement):
+                return resampled
+
+        ul_coords, ur_coords, dl_coords, _ = corner_coords
+        right_vect = ur_coords - ul_coords
+        down_vect = dl_coords - ul_coords
+        center_coords = ul_coords + (right_vect + down_vect) / 2
+
+        sub_image = Image.fromarray(pixels, mode="RGBA")
+
+        # Reshape
+        pixel_width = max(int(pdist([ul_coords, ur_coords]).item()), 1)
+        pixel_height = max(int(pdist([ul_coords, dl_coords]).item()), 1)
+        sub_image = sub_image.resize(
+            (pixel_width, pixel_height),
+            resample=image_mobject.resampling_algorithm
+        )
+
+        # Rotate
+        angle = angle_of_vector(right_vect)
+        adjusted_angle = -int(360 * angle / TAU)
+        if adjusted_angle != 0:
+            sub_image = sub_image.rotate(
+                adjusted_angle,
+                resample=image_mobject.resampling_algorithm,
+                expand=1
+            )
+
+        left, top = (center_coords - np.array(sub_image.size) / 2).astype(int)
+        resampled = (sub_image, int(left), int(top))
+        self._resampled[image_mobject] = (pixels, checksum, placement, resampled)
+        return resampled
+
+    def display_image_mobject(self, image_mobject: ImageMobject, pixel_array: np.ndarray):
+        """
+        Blend an ImageMobject into the frame from its cached resampled image
+
+        Only the pixels the image covers are composited, with the same
+        Image.alpha_composite that Camera.overlay_PIL_image applies to a
+        transparent frame-sized copy.
+        """
+        sub_image, left, top = self.resampled_image(image_mobject)
+        width, height = sub_image.size
+        x0, y0 = max(left, 0), max(top, 0)
+        x1 = min(left + width, pixel_array.shape[1])
+        y1 = min(top + height, pixel_array.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        region = pixel_array[y0:y1, x0:x1]
+        patch = sub_image.crop((x0 - left, y0 - top, x1 - left, y1 - top))
+        region[:] = np.asarray(
+            Image.alpha_composite(Image.fromarray(np.ascontiguousarray(region), mode=self.image_mode), patch)
+        )
+
+    def display_multiple_line_collections(self, collections, pixel_array: np.ndarray):
+        ctx = self.get_cairo_context(pixel_array)
+        for lines in collections:
+            self.display_line_collection(lines, ctx)
+
+    def display_line_collection(self, lines: LineCollection, ctx):
+        """
+        Stroke the segments of a collection, one cairo path per style
+
+        Opaque segments sharing a color and width are stroked together,
+        styles in order of their first segment, so a collection of a few
+        colors costs a few strokes per frame. Translucent segments are
+        stroked one by one, so where they overlap their alpha builds up as
+        it does for separate Lines.
+        """
+        starts, ends, index = lines.visible_segments()
+        if len(index) == 0:
+            return
+        styles = np.column_stack([lines.rgbas[index], lines.widths[index]])
+        unique_styles, first, style_of = np.unique(
+            styles, axis=0, return_index=True, return_inverse=True
+        )
+        style_of = style_of.ravel()
+        segment_order = np.argsort(style_of, kind="stable")
+        bounds = np.searchsorted(style_of[segment_order], np.arange(len(unique_styles) + 1))
+        starts = starts[:, :2].tolist()
+        ends = ends[:, :2].tolist()
+
+        # The context is shared with manim's drawing, which leaves paths behind with *_preserve
+        ctx.new_path()
+        for style_index in np.argsort(first):
+            red, green, blue, opacity, width = unique_styles[style_index]
+            # The cairo surface stores channels in reverse, as in Camera.set_cairo_context_color
+            ctx.set_source_rgba(blue, green, red, opacity)
+            ctx.set_line_width(width * self.cairo_line_width_multiple)
+            for i in segment_order[bounds[style_index]:bounds[style_index + 1]]:
+                ctx.move_to(*starts[i])
+                ctx.line_to(*ends[i])
+                if opacity < 1:
+                    ctx.stroke()
+            if opacity >= 1:
+                ctx.stroke()
+
+
+class CASScene(Scene):
+    """Scene rendered with CASCamera, for scenes using the custom mobjects"""
+
+    def __init__(self, camera_class=CASCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
@@ -0,0 +1,191 @@
+"""
+Catalog of the image-sequence folders in images/
+
+Each folder holds the generations of one concept combination. The catalog
+records, per folder, the parsed concepts and the images in numeric
+generation order with their pixel size and content hash. It is saved to
+media/cache/asset_catalog.json and updated incrementally: only files whose
+size or modification time changed are read again.
+
+Scenes query the catalog instead of listing folders themselves.
+"""
+
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_DIR = os.path.join(PROJECT_DIR, "images")
+CATALOG_FILE = os.path.join(PROJECT_DIR, "media", "cache", "asset_catalog.json")
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp")
+
+# "image__gen4.png", "alien_gen10.png"; otherwise the last number in the name
+_GENERATION_PATTERNS = [re.compile(r"gen_*(\d+)", re.IGNORECASE), re.compile(r"(\d+)(?!.*\d)")]
+
+
+def parse_concepts(folder_name: str) -> List[str]:
+    """Concepts of a folder name, e.g. "abstract-expressionism_earth" ->
+    ["Abstract Expressionism", "Earth"]"""
+    # Replace underscores and hyphens with spaces and capitalize each word
+    concepts = folder_name.replace('_', ' ').replace('-', ' ').title()
+
+    # Keep "Abstract Expressionism" as one concept
+    if "Abstract Expressionism" in concepts:
+        other_parts = concepts.replace("Abstract Expressionism", "").split()
+        return ["Abstract Expressionism"] + other_parts
+    return concepts.split()
+
+
+def parse_generation(file_name: str) -> Optional[int]:
+    """Generation number in an image file name, or None"""
+    stem = os.path.splitext(file_name)[0]
+    for pattern in _GENERATION_PATTERNS:
+        match = pattern.search(stem)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def generation_key(file_name: str):
+    """Sort key putting numbered generations first, in numeric order, then the rest by name"""
+    generation = parse_generation(file_name)
+    return (generation is None, generation or 0, file_name)
+
+
+def sha256_file(path: str) -> str:
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _describe_image(path: str, stat: os.stat_result) -> dict:
+    from PIL import Image  # Only needed for new or changed images
+
+    with Image.open(path) as image:
+        width, height = image.size
+    return {
+        "file": os.path.basename(path),
+        "generation": parse_generation(os.path.basename(path)),
+        "width": width,
+        "height": height,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha256_file(path)
+    }
+
+
+def _load(catalog_file: str) -> dict:
+    try:
+        with open(catalog_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(catalog: dict, catalog_file: str):
+    from scenes.assets import atomic_write  # scenes.assets imports this module
+
+    def write(tmp_file):
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, indent=2)
+
+    # Concurrent renders never read a partial file
+    atomic_write(catalog_file, write)
+
+
+def build_catalog(root: str = IMAGES_DIR, catalog_file: str = CATALOG_FILE) -> dict:
+    """
+    Scan the asset root and bring the saved catalog up to date
+
+    Images whose size and modification time match the saved entry are not
+    read again; new or changed images are hashed and measured, and removed
+    ones are dropped. The catalog file is only rewritten when it changed.
+
+    Returns:
+        {"root": root, "folders": {folder name: {"concepts": [...],
+        "images": [{"file", "generation", "width", "height", "size",
+        "mtime_ns", "sha256"}, ...]}}}, images in generation order
+    """
+    saved = _load(catalog_file)
+    saved_folders = saved.get("folders", {}) if saved.get("root") == root else {}
+
+    folders = {}
+    if os.path.isdir(root):
+        for folder in sorted(entry.name for entry in os.scandir(root) if entry.is_dir()):
+            known = {
+                image["file"]: image
+                for image in saved_folders.get(folder, {}).get("images", [])
+            }
+            images = []
+            for entry in os.scandir(os.path.join(root, folder)):
+                if not (entry.is_file()
+                        and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS):
+                    continue
+                stat = entry.stat()
+                image = known.get(entry.name)
+                if not (image and image["size"] == stat.st_size
+                        and image["mtime_ns"] == stat.st_mtime_ns):
+                    image = _describe_image(entry.path, stat)
+                images.append(image)
+            folders[folder] = {
+                "concepts": parse_concepts(folder),
+                "images": sorted(images, key=lambda image: generation_key(image["file"]))
+            }
+
+    catalog = {"root": root, "folders": folders}
+    if catalog != saved:
+        _save(catalog, catalog_file)
+    return catalog
+
+
+@lru_cache(maxsize=None)
+def load_catalog(root: str = IMAGES_DIR) -> dict:
+    """The up-to-date catalog, built once per process"""
+    return build_catalog(root)
+
+
+def sequence_folders(root: str = IMAGES_DIR) -> List[str]:
+    """Names of the folders that hold at least one image, sorted by name"""
+    return [
+        folder for folder, info in load_catalog(root)["folders"].items()
+        if info["images"]
+    ]
+
+
+def sequence(folder: str, root: str = IMAGES_DIR) -> Dict:
+    """
+    A folder's concepts and images
+
+    Returns:
+        {"concepts": [...], "images": [...]} where each image entry also has
+        its absolute "path"; images are in generation order
+    """
+    info = load_catalog(root)["folders"][folder]
+    return {
+        "concepts": info["concepts"],
+        "images": [
+            dict(image, path=os.path.join(root, folder, image["file"]))
+            for image in info["images"]
+        ]
+    }
+
+
+def known_hash(path: str, stat: os.stat_result) -> Optional[str]:
+    """Content hash of a cataloged image, if its catalog entry is still current"""
+    folder_path, file_name = os.path.split(os.path.abspath(path))
+    root, folder = os.path.split(folder_path)
+    if root != IMAGES_DIR:
+        return None
+    for image in load_catalog(root)["folders"].get(folder, {}).get("images", []):
+        if (image["file"] == file_name and image["size"] == stat.st_size
+                and image["mtime_ns"] == stat.st_mtime_ns):
+            return image["sha256"]
+    return None
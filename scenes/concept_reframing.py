@@ -6,14 +6,19 @@ Shows art as conceptual combinations rather than visual objects
 from manim import *
 import numpy as np
 
+from scenes.assets import load_image
+from scenes.camera import CASScene, bloom
+from scenes.mobjects import DrawSegments, LineCollection, MovePoints, PointCloud
+from scenes.texts import cached_text
 
-class ConceptReframing(Scene):
+
+class ConceptReframing(CASScene):
     def construct(self):
         # Title - simpler animation
-        title = Text("Our Reframing: Painting as a Conceptual Combination", font_size=32).to_edge(UP)
+        title = cached_text("Our Reframing: Painting as a Conceptual Combination", font_size=32).to_edge(UP)
         
         # Start with a traditional art view - simpler animation
-        traditional_label = Text(
+        traditional_label = cached_text(
             "Traditional View: Painting as Visual Object",
             font_size=32,
             color=GREY
@@ -23,7 +28,7 @@ class ConceptReframing(Scene):
         try:
             import os
             image_path = os.path.join(os.path.dirname(__file__), "..", "river-st-urbain-1930.jpg!Large.jpg")
-            artwork = ImageMobject(image_path).scale(1.2)  # Bigger initial size
+            artwork = load_image(image_path, scale=1.2)  # Bigger initial size
             artwork.shift(DOWN * 0.5)
         except:
             # Placeholder if image not found - also bigger
@@ -134,7 +139,7 @@ class ConceptReframing(Scene):
         self.wait(0.8)
         
         # Show the combinatorial space
-        subtitle = Text(
+        subtitle = cached_text(
             "Painting generation -> Strategic Recombination of Concepts",
             font_size=32,
             color=YELLOW
@@ -151,12 +156,10 @@ class ConceptReframing(Scene):
         
         # Create a line with glow effect
         def create_glowing_line(start, end, color=BLUE):
-            # Main line
+            # Main line; the camera's bloom spreads its light about as wide
+            # as the 10-wide translucent strokes once drawn behind it
             main_line = Line(start, end, stroke_width=2.5, color=color, stroke_opacity=0.8)
-            # Glow layers
-            glow1 = Line(start, end, stroke_width=6, color=color, stroke_opacity=0.3)
-            glow2 = Line(start, end, stroke_width=10, color=color, stroke_opacity=0.15)
-            return VGroup(glow2, glow1, main_line)
+            return bloom(main_line, radius=0.03, strength=1.6)
         
         # Connect center (index 4) to all corners (indices 0,1,2,3)
         center_idx = 4
@@ -199,7 +202,7 @@ class ConceptReframing(Scene):
         )
         
         # New title for this section
-        why_better_title = Text(
+        why_better_title = cached_text(
             "Why is this reframing advantageous?",
             font_size=32
         ).to_edge(UP)
@@ -211,7 +214,7 @@ class ConceptReframing(Scene):
         self.wait(0.5)
         
         # Show the explanation text
-        explanation_text = Text(
+        explanation_text = cached_text(
             "We transform an intractable problem into a discrete\n"
             "navigation task that aligns naturally\n"
             "with the associative and combinatorial strengths of LLMs.",
@@ -226,7 +229,7 @@ class ConceptReframing(Scene):
         self.play(FadeOut(explanation_text), run_time=0.8)
         
         # VISUAL PART 1: Show opaque box - Space of paintings
-        paintings_label = Text(
+        paintings_label = cached_text(
             "Space of paintings (difficult to navigate strategically for LLMs)",
             font_size=28,
             color=RED
@@ -276,44 +279,37 @@ class ConceptReframing(Scene):
         self.play(FadeOut(paintings_label), run_time=0.5)
         
         # Generate positions for the concept cloud (centered)
+        # Draws (angle, radius) pairs in the same order as per-point uniform() calls
         np.random.seed(123)
         num_concepts = 1000  # "Millions" represented by many dots
-        positions = []
         cloud_center = ORIGIN
         
-        for i in range(num_concepts):
-            # Spread out in a much larger area
-            angle = np.random.uniform(0, 2*PI)
-            radius_val = np.random.uniform(0.3, 3.2)
-            x = radius_val * np.cos(angle)
-            y = radius_val * np.sin(angle)
-            
-            position = cloud_center + RIGHT * x + UP * y
-            positions.append(position)
+        # Spread out in a much larger area
+        samples = np.random.random_sample((num_concepts, 2))
+        angles = samples[:, 0] * 2*PI
+        radius_vals = 0.3 + samples[:, 1] * (3.2 - 0.3)
+        positions = cloud_center + np.column_stack([
+            radius_vals * np.cos(angles),
+            radius_vals * np.sin(angles),
+            np.zeros(num_concepts)
+        ])
         
         # Create the concept cloud with dots starting from inside/on the box
-        concept_cloud = VGroup()
         color_choices = [BLUE, GREEN, TEAL, YELLOW, ORANGE, PURPLE, PINK, MAROON]
         
         # Generate initial positions for dots inside the cube volume
+        # (z kept at 0, in 2D for simplicity)
         box_size = 2.5
-        initial_positions = []
-        for i in range(num_concepts):
-            # Random position inside the cube
-            x = np.random.uniform(-box_size/2, box_size/2)
-            y = np.random.uniform(-box_size/2, box_size/2)
-            z = 0  # Keep in 2D for simplicity
-            initial_positions.append(np.array([x, y, z]))
-        
-        for i in range(num_concepts):
-            color = color_choices[i % len(color_choices)]
-            dot = Dot(
-                point=initial_positions[i],
-                radius=0.015,
-                color=color,
-                fill_opacity=0.7
-            )
-            concept_cloud.add(dot)
+        initial_positions = np.zeros((num_concepts, 3))
+        initial_positions[:, :2] = -box_size/2 + np.random.random_sample((num_concepts, 2)) * box_size
+        
+        # One point cloud instead of a Dot per concept
+        concept_cloud = PointCloud(
+            initial_positions,
+            colors=color_choices,  # Cycled over the points
+            radii=0.015,
+            opacities=0.7
+        )
         
         # Box dissolves: it becomes the colorful points
         # First make box semi-transparent and show the dots inside
@@ -324,20 +320,16 @@ class ConceptReframing(Scene):
         )
         
         # Now the box completely disappears as dots spread out
-        animations = []
-        for i, dot in enumerate(concept_cloud):
-            animations.append(dot.animate.move_to(positions[i]))
-        
         self.play(
             FadeOut(opaque_box),
-            *animations,
+            MovePoints(concept_cloud, positions),
             run_time=2.5,
             rate_func=rush_from
         )
         self.wait(0.5)
         
         # VISUAL PART 2: Show new label for concept space
-        concepts_label = Text(
+        concepts_label = cached_text(
             "Space of concepts",
             font_size=28,
             color=GREEN
@@ -351,78 +343,68 @@ class ConceptReframing(Scene):
         
         # Show millions of thin glowing trajectories connecting sets of 5 concepts each
         trajectory_colors = [YELLOW, ORANGE, PINK, TEAL, PURPLE, GREEN, RED]
-        all_trajectories = VGroup()
         
         # Create many trajectories (representing millions)
         num_trajectories = 25 # Represents "millions" of possible paths
+        hops_per_trajectory = 4
         
+        segment_starts = []
+        segment_ends = []
+        segment_colors = []
         for traj_idx in range(num_trajectories):
             # Pick 5 random concepts for this trajectory
             np.random.seed(42 + traj_idx)
-            selected_indices = np.random.choice(num_concepts, size=5, replace=False)
-            selected_positions = [positions[idx] for idx in selected_indices]
+            selected_indices = np.random.choice(num_concepts, size=hops_per_trajectory + 1, replace=False)
+            selected_positions = positions[selected_indices]
             
             # Pick a color for this trajectory
             color = trajectory_colors[traj_idx % len(trajectory_colors)]
             
-            # Create thin glowing lines connecting these 5 concepts
-            trajectory = VGroup()
-            for i in range(len(selected_positions) - 1):
-                # Glow layer: subtle
-                glow = Line(
-                    selected_positions[i],
-                    selected_positions[i + 1],
-                    stroke_width=3,
-                    color=color,
-                    stroke_opacity=0.15
-                )
-                trajectory.add(glow)
-                
-                # Main line: Very thin
-                line = Line(
-                    selected_positions[i],
-                    selected_positions[i + 1],
-                    stroke_width=0.8,
-                    color=color,
-                    stroke_opacity=0.6
-                )
-                trajectory.add(line)
-            
-            all_trajectories.add(trajectory)
+            # Each hop: a very thin main line
+            segment_starts.append(selected_positions[:-1])
+            segment_ends.append(selected_positions[1:])
+            segment_colors += [color] * hops_per_trajectory
+        
+        # All trajectories in one line collection, hidden until drawn on;
+        # the bloom stands in for a subtle 3-wide glow layer under each hop
+        all_trajectories = bloom(
+            LineCollection(
+                np.concatenate(segment_starts),
+                np.concatenate(segment_ends),
+                colors=segment_colors,
+                widths=0.8,
+                opacities=0.6,
+                drawn=0
+            ),
+            radius=0.015
+        )
+        
+        def trajectory_segments(first, last=None):
+            """Segments of trajectories first..last-1 (to the end by default)"""
+            stop = None if last is None else last * hops_per_trajectory
+            return slice(first * hops_per_trajectory, stop)
         
-        # Animate trajectories: first 5 in a staggered way, then the rest all at once
-        # First 5 trajectories - staggered start with overlap
-        if len(all_trajectories) >= 3:
+        # Animate trajectories: first 3 one after another, then the rest all at once
+        if num_trajectories >= 3:
             for i in range(3):
-                if i == 0:
-                    # First trajectory plays fully
-                    self.play(
-                        Create(all_trajectories[i]),
-                        run_time=1.2,
-                        rate_func=linear
-                    )
-                else:
-                    # Each subsequent trajectory starts when the previous is halfway
-                    # We need to start the next animation before the previous finishes
-                    # Use a shorter duration and no wait
-                    self.play(
-                        Create(all_trajectories[i]),
-                        run_time=1.2,
-                        rate_func=linear
-                    )
+                # Each trajectory draws its segments one after another, like Create
+                self.play(
+                    DrawSegments(all_trajectories, trajectory_segments(i, i + 1)),
+                    run_time=1.2,
+                    rate_func=linear
+                )
 
             # Now animate the rest all at once (if there are more than 3)
-            if len(all_trajectories) > 3:
-                remaining_trajectories = VGroup(*[all_trajectories[i] for i in range(3, len(all_trajectories))])
+            if num_trajectories > 3:
                 self.play(
-                    Create(remaining_trajectories, lag_ratio=0.002),
+                    DrawSegments(all_trajectories, trajectory_segments(3), lag_ratio=0.002),
                     run_time=2.5,
                     rate_func=linear
                 )
         else:
-            # Fallback if less than 5 trajectories
+            # Fallback if less than 3 trajectories
             self.play(
-                Create(all_trajectories, lag_ratio=0.002),
+                DrawSegments(all_trajectories, lag_ratio=0.002),
                 run_time=4,
                 rate_func=linear
             )
@@ -430,7 +412,7 @@ class ConceptReframing(Scene):
         self.wait(1)
         
         # Add "Easier to explore strategically" in the middle of the screen with opaque background
-        explore_label = Text(
+        explore_label = cached_text(
             "Easier to explore strategically",
             font_size=32,
             color=GREEN,
@@ -462,7 +444,7 @@ class ConceptReframing(Scene):
     
     def create_concept_tag(self, text: str, color: str) -> VGroup:
         """Helper to create a rounded rectangle concept tag"""
-        label = Text(text, font_size=22, color=WHITE, weight=BOLD)
+        label = cached_text(text, font_size=22, color=WHITE, weight=BOLD)
         box = SurroundingRectangle(
             label,
             color=color,
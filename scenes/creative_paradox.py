@@ -5,16 +5,19 @@ Illustrates the tension between originality and coherence in AI creativity
 
 from manim import *
 
+from scenes.camera import CASScene
+from scenes.texts import cached_text
 
-class CreativeParadox(Scene):
+
+class CreativeParadox(CASScene):
     def construct(self):
         # Create two concept circles
         original = Circle(radius=1.5, color=ORANGE).shift(LEFT * 3.5)
         coherent = Circle(radius=1.5, color=TEAL).shift(RIGHT * 3.5)
         
         # Labels
-        orig_label = Text("Original", font_size=40).next_to(original, UP)
-        coh_label = Text("Coherent", font_size=40).next_to(coherent, UP)
+        orig_label = cached_text("Original", font_size=40).next_to(original, UP)
+        coh_label = cached_text("Coherent", font_size=40).next_to(coherent, UP)
         
         # Visual representations inside circles
         # Original: scattered, diverging arrows
@@ -49,7 +52,7 @@ class CreativeParadox(Scene):
         )
         
         # Question
-        question = Text(
+        question = cached_text(
             "Can AI be both?",
             font_size=48,
             color=WHITE
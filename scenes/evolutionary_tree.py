@@ -6,11 +6,14 @@ Synchronized to show one image per second
 
 from manim import *
 import numpy as np
-from PIL import Image
-import os
 
+from scenes.camera import CASScene, bloom
+from scenes.mobjects import LineCollection, MediaMobject, PointCloud
+from scenes.texts import cached_text
+from scenes.timeline import Timeline, progress
 
-class EvolutionaryTree(Scene):
+
+class EvolutionaryTree(CASScene):
     def construct(self):
         # Set background to dark for better glow effect
         self.camera.background_color = "#0a0a0a"
@@ -23,81 +26,56 @@ class EvolutionaryTree(Scene):
         # Generate tree structure first
         tree_data = self._generate_background_tree(num_generations)
         
-        # Create all tree elements but keep them invisible initially
-        tree_lines = VGroup()
-        tree_glows = VGroup()
-        tree_nodes = VGroup()
-        
-        for i, node in enumerate(tree_data):
-            if i == 0:
-                continue  # Skip root
-            
-            # Create glowing line
-            line = Line(
-                node['parent_pos'],
-                node['pos'],
-                stroke_width=2,  # Slightly thicker main line
-                stroke_opacity=0
-            ).set_color(node['color'])
-            
-            # Create glow effect (thick, very transparent line behind)
-            glow_line = Line(
-                node['parent_pos'],
-                node['pos'],
-                stroke_width=15,  # Much thicker glow for visibility
-                stroke_opacity=0
-            ).set_color(node['color'])
-            
-            # Create small node
-            dot = Dot(
-                node['pos'],
-                radius=0.04,  # Slightly larger for visibility at edges
-                color=node['color'],
-                fill_opacity=0
-            )
-            
-            tree_lines.add(line)
-            tree_glows.add(glow_line)
-            tree_nodes.add(dot)
-        
-        # Add tree to scene (in background)
-        self.add(tree_glows, tree_lines, tree_nodes)
+        # Create all tree elements but keep them invisible initially:
+        # thin glow sources that only feed the camera's bloom, the main
+        # lines, and one point cloud for the nodes
+        branches = tree_data[1:]  # Skip root
+        num_branches = len(branches)
+        starts = np.array([node['parent_pos'] for node in branches])
+        ends = np.array([node['pos'] for node in branches])
+        colors = [node['color'] for node in branches]
+        
+        # The blur spreads each source over about the width of a 15-wide
+        # stroke; the strength keeps the glow's total light the same
+        tree_glows = bloom(
+            LineCollection(starts, ends, colors=colors, widths=2, opacities=0),
+            radius=0.04,
+            strength=7.5,
+            glow_only=True
+        )
+        tree_lines = LineCollection(
+            starts,
+            ends,
+            colors=colors,
+            widths=2,  # Slightly thicker main line
+            opacities=0
+        )
+        tree_nodes = PointCloud(
+            ends,
+            colors=colors,
+            radii=0.04,  # Slightly larger for visibility at edges
+            opacities=0
+        )
+        
+        # Add tree to scene (in background); the gif and its frame are added
+        # after it, so they are redrawn with it while the timeline plays
+        tree = Group(tree_glows, tree_lines, tree_nodes)
+        self.add(tree)
         
         # Create centered GIF frame
         gif_size = 6.5
-        gif_frames = []
         gif_mobject = None
         
         try:
-            # Try to load and extract gif frames
+            # Stream the gif, one frame per image period, decoding only the frame shown;
+            # each frame crossfades in while the next node's glow appears
             gif_path = "romanticism-landscape.gif"
-            
-            # Load GIF using PIL to extract frames
-            pil_gif = Image.open(gif_path)
-            
-            # Extract all frames
-            frame_count = 0
-            try:
-                while True:
-                    # Convert current frame to ImageMobject
-                    frame_path = f"/tmp/gif_frame_{frame_count}.png"
-                    pil_gif.save(frame_path)
-                    frame_mob = ImageMobject(frame_path).scale_to_fit_height(gif_size)
-                    frame_mob.move_to(ORIGIN)
-                    gif_frames.append(frame_mob)
-                    
-                    frame_count += 1
-                    pil_gif.seek(frame_count)
-            except EOFError:
-                pass  # End of frames
-            
-            # If we have frames, start with the first one
-            if gif_frames:
-                gif_mobject = gif_frames[0]
-            else:
-                # Fallback to static image
-                gif_mobject = ImageMobject(gif_path).scale_to_fit_height(gif_size)
-                gif_mobject.move_to(ORIGIN)
+            gif_mobject = MediaMobject(
+                gif_path,
+                height=gif_size,
+                frame_rate=1 / seconds_per_image,
+                crossfade=seconds_per_image * 0.3
+            ).move_to(ORIGIN)
             
             # Add subtle frame around gif
             gif_frame = Rectangle(
@@ -125,7 +103,7 @@ class EvolutionaryTree(Scene):
                 stroke_opacity=0.3
             ).move_to(ORIGIN)
             
-            placeholder_text = Text(
+            placeholder_text = cached_text(
                 "evolution.gif",
                 font_size=24,
                 color=GREY,
@@ -134,40 +112,31 @@ class EvolutionaryTree(Scene):
             
             self.add(placeholder, placeholder_text)
         
-        # Animate tree growth synchronized with gif (1 second per image)
-        nodes_per_second = num_generations / (num_generations * seconds_per_image)
+        # Animate tree growth synchronized with gif (1 second per image).
+        # Node i grows during [i, i + 1) image periods: its glow fades in
+        # (first 30%), then its line and node (next 40%), then the glow
+        # pulses (last 30%). The whole growth is one play driven by time.
+        node_starts = np.arange(num_branches) * seconds_per_image
+        glow_time = seconds_per_image * 0.3
+        line_time = seconds_per_image * 0.4
+        pulse_time = seconds_per_image * 0.3
         
-        frame_index = 0
-        for i in range(len(tree_data) - 1):
-            # Update GIF frame if we have multiple frames
-            if gif_frames and len(gif_frames) > 1 and gif_mobject is not None:
-                next_frame_index = (frame_index + 1) % len(gif_frames)
-                self.play(
-                    Transform(gif_mobject, gif_frames[next_frame_index]),
-                    tree_glows[i].animate.set_stroke(opacity=0.3),
-                    run_time=seconds_per_image * 0.3
-                )
-                frame_index = next_frame_index
-            else:
-                # Fade in the glow
-                self.play(
-                    tree_glows[i].animate.set_stroke(opacity=0.3),
-                    run_time=seconds_per_image * 0.3
-                )
+        def grow_tree(time):
+            glow = progress(time, node_starts, glow_time)
+            line = progress(time, node_starts + glow_time, line_time)
+            pulse = progress(time, node_starts + glow_time + line_time, pulse_time, there_and_back)
             
-            # Fade in the line and node (no need to update frame here)
-            self.play(
-                tree_lines[i].animate.set_stroke(opacity=0.6),
-                tree_nodes[i].animate.set_fill(opacity=0.8),
-                run_time=seconds_per_image * 0.4
-            )
-            
-            # Pulse the glow (no need to update frame here)
-            self.play(
-                tree_glows[i].animate.set_stroke(opacity=0.5, width=20),  # Larger pulse
-                rate_func=there_and_back,
-                run_time=seconds_per_image * 0.3
-            )
+            tree_glows.rgbas[:, 3] = 0.3 * glow + 0.2 * pulse
+            tree_glows.widths[:] = 2 * (1 + pulse / 3)  # Pulse a third wider
+            tree_lines.rgbas[:, 3] = 0.6 * line
+            tree_nodes.rgbas[:, 3] = 0.8 * line
+        
+        tracks = [grow_tree]
+        if gif_mobject is not None:
+            # The gif advances to its next frame as each node starts growing
+            tracks.append(lambda time: gif_mobject.set_time(seconds_per_image + time))
+        
+        self.play(Timeline(tree, *tracks, run_time=num_branches * seconds_per_image))
         
         # Final hold
         self.wait(2)
@@ -175,6 +144,9 @@ class EvolutionaryTree(Scene):
     def _generate_background_tree(self, num_nodes):
         """Generate a tree structure that fills the background"""
         
+        # Fixed seed so every render, including split renders, grows the same tree
+        np.random.seed(2025)
+        
         # Start from center
         root_pos = ORIGIN
         
@@ -5,18 +5,21 @@ Shows key findings from human evaluation and quantitative analysis
 
 from manim import *
 
+from scenes.camera import CASScene
+from scenes.texts import cached_markup_text, cached_text
 
-class ExperimentalResults(Scene):
+
+class ExperimentalResults(CASScene):
     def construct(self):
         # Title
-        title = Text("Experimental Results", font_size=48, weight=BOLD).to_edge(UP)
+        title = cached_text("Experimental Results", font_size=48, weight=BOLD).to_edge(UP)
         self.play(Write(title), run_time=0.8)
         self.wait(0.3)
         
         # ============================================================
         # FINDING 1: Human Evaluation - Originality
         # ============================================================
-        finding1_title = Text(
+        finding1_title = cached_text(
             "Human Evaluation of Paintings: Originality",
             font_size=36,
             color=BLUE_B,
@@ -25,17 +28,17 @@ class ExperimentalResults(Scene):
         
         # Create ranking display
         ranking1 = VGroup(
-            Text("Human", font_size=32, color=ORANGE, weight=BOLD),
-            Text("≈", font_size=32, color=WHITE),
-            Text("CAS", font_size=32, color=GREEN, weight=BOLD),
-            Text(">", font_size=32, color=WHITE),
-            Text("GPT", font_size=32, color=PURPLE),
-            Text(">", font_size=32, color=WHITE),
-            Text("Random", font_size=32, color=GREY)
+            cached_text("Human", font_size=32, color=ORANGE, weight=BOLD),
+            cached_text("≈", font_size=32, color=WHITE),
+            cached_text("CAS", font_size=32, color=GREEN, weight=BOLD),
+            cached_text(">", font_size=32, color=WHITE),
+            cached_text("GPT", font_size=32, color=PURPLE),
+            cached_text(">", font_size=32, color=WHITE),
+            cached_text("Random", font_size=32, color=GREY)
         ).arrange(RIGHT, buff=0.3).shift(UP * 0.3)
         
         # Key insight
-        insight1 = Text(
+        insight1 = cached_text(
             "Human + CAS lead in originality",
             font_size=28,
             color=YELLOW,
@@ -61,7 +64,7 @@ class ExperimentalResults(Scene):
         # ============================================================
         # FINDING 2: Human Evaluation - Harmony
         # ============================================================
-        finding2_title = Text(
+        finding2_title = cached_text(
             "Human Evaluation of Paintings: Harmony",
             font_size=36,
             color=GREEN_B,
@@ -70,16 +73,16 @@ class ExperimentalResults(Scene):
         
         # Create ranking display
         ranking2 = VGroup(
-            Text("CAS", font_size=32, color=GREEN, weight=BOLD),
-            Text("≈", font_size=32, color=WHITE),
-            Text("Human", font_size=32, color=ORANGE, weight=BOLD),
-            Text(">", font_size=32, color=WHITE),
-            Text("GPT", font_size=32, color=PURPLE),
-            Text(">", font_size=32, color=WHITE),
-            Text("Random", font_size=32, color=GREY)
+            cached_text("CAS", font_size=32, color=GREEN, weight=BOLD),
+            cached_text("≈", font_size=32, color=WHITE),
+            cached_text("Human", font_size=32, color=ORANGE, weight=BOLD),
+            cached_text(">", font_size=32, color=WHITE),
+            cached_text("GPT", font_size=32, color=PURPLE),
+            cached_text(">", font_size=32, color=WHITE),
+            cached_text("Random", font_size=32, color=GREY)
         ).arrange(RIGHT, buff=0.3).shift(UP * 0.3)
         
-        insight2 = Text(
+        insight2 = cached_text(
             "CAS best in harmony (tied with Human)",
             font_size=28,
             color=YELLOW,
@@ -104,7 +107,7 @@ class ExperimentalResults(Scene):
         # ============================================================
         # FINDING 3: Concept Repetition
         # ============================================================
-        finding3_title = Text(
+        finding3_title = cached_text(
             "Concept Repetition Across Runs",
             font_size=36,
             color=RED_B,
@@ -134,8 +137,8 @@ class ExperimentalResults(Scene):
                 stroke_width=2
             ).move_to([x_pos, bar_height/2 - 1, 0])
             
-            label = Text(method, font_size=24, color=WHITE, weight=BOLD).next_to(bar, DOWN, buff=0.2)
-            score_text = Text(f"{rep:.1f}%", font_size=26, color=color, weight=BOLD).next_to(bar, UP, buff=0.1)
+            label = cached_text(method, font_size=24, color=WHITE, weight=BOLD).next_to(bar, DOWN, buff=0.2)
+            score_text = cached_text(f"{rep:.1f}%", font_size=26, color=color, weight=BOLD).next_to(bar, UP, buff=0.1)
             
             bars3.add(VGroup(bar, label, score_text))
         
@@ -147,7 +150,7 @@ class ExperimentalResults(Scene):
             run_time=1.5
         )
         
-        insight3 = Text(
+        insight3 = cached_text(
             "GPT repeats ideas the most (~74%)",
             font_size=28,
             color=YELLOW,
@@ -158,7 +161,7 @@ class ExperimentalResults(Scene):
         self.wait(1.5)
         
         # Final summary - line 1
-        summary1 = MarkupText(
+        summary1 = cached_markup_text(
             f"CAS achieves human-level <span fgcolor='{BLUE}' weight='bold'>originality</span> and <span fgcolor='{RED}' weight='bold'>harmony</span>",
             font_size=28,
             color=GREEN,
@@ -166,7 +169,7 @@ class ExperimentalResults(Scene):
         ).move_to(ORIGIN).shift(UP * 0.3)
         
         # Final summary - line 2
-        summary2 = MarkupText(
+        summary2 = cached_markup_text(
             f"with greater <span fgcolor='{YELLOW}' weight='bold'>conceptual diversity</span> than GPT.",
             font_size=28,
             color=GREEN,
@@ -197,7 +200,7 @@ class ExperimentalResults(Scene):
         )
         
         # Main headline - highlighted
-        headline = Text(
+        headline = cached_text(
             "Bigger is not always better",
             font_size=48,
             color=YELLOW,
@@ -205,7 +208,7 @@ class ExperimentalResults(Scene):
         ).move_to(ORIGIN).shift(UP * 0.5)
         
         # Supporting text - line 1
-        supporting_text1 = Text(
+        supporting_text1 = cached_text(
             "Lightweight task-specific models can outperform",
             font_size=36,
             color=WHITE,
@@ -213,7 +216,7 @@ class ExperimentalResults(Scene):
         ).move_to(ORIGIN).shift(DOWN * 0.5)
         
         # Supporting text - line 2
-        supporting_text2 = Text(
+        supporting_text2 = cached_text(
             "frontier LLMs in creative tasks.",
             font_size=36,
             color=WHITE,
@@ -5,10 +5,13 @@ Illustrates the gap between LLM success in verifiable domains vs culturally-situ
 
 from manim import *
 
+from scenes.camera import CASScene
+from scenes.texts import cached_text
+
 ORANGE_A = "#FF8C00"
 
 
-class GeneralProblem(Scene):
+class GeneralProblem(CASScene):
     def construct(self):
         # ============================================================
         # PART 1: Current Trend - Success in Verifiable Domains
@@ -16,12 +19,12 @@ class GeneralProblem(Scene):
         
         # Main message
         trend_message = VGroup(
-            Text(
+            cached_text(
                 "Open-ended LLM systems are gaining traction",
                 font_size=36,
                 weight=BOLD
             ),
-            Text(
+            cached_text(
                 "for discovery in verifiable domains",
                 font_size=36,
                 weight=BOLD
@@ -35,7 +38,7 @@ class GeneralProblem(Scene):
         self.wait(0.5)
         
         # Examples with clean boxes
-        examples_title = Text(
+        examples_title = cached_text(
             "Examples:",
             font_size=28,
             color=GREY_A
@@ -55,7 +58,7 @@ class GeneralProblem(Scene):
                 stroke_color=GREEN,
                 stroke_width=3
             ),
-            Text("Math", font_size=28, color=GREEN, weight=BOLD)
+            cached_text("Math", font_size=28, color=GREEN, weight=BOLD)
         ).arrange(DOWN, buff=0)
         math_box[1].move_to(math_box[0])
         
@@ -68,7 +71,7 @@ class GeneralProblem(Scene):
                 stroke_color=BLUE,
                 stroke_width=3
             ),
-            Text("Science", font_size=28, color=BLUE, weight=BOLD)
+            cached_text("Science", font_size=28, color=BLUE, weight=BOLD)
         ).arrange(DOWN, buff=0)
         science_box[1].move_to(science_box[0])
         
@@ -81,7 +84,7 @@ class GeneralProblem(Scene):
                 stroke_color=PURPLE,
                 stroke_width=3
             ),
-            Text("Coding", font_size=28, color=PURPLE, weight=BOLD)
+            cached_text("Coding", font_size=28, color=PURPLE, weight=BOLD)
         ).arrange(DOWN, buff=0)
         code_box[1].move_to(code_box[0])
         
@@ -104,12 +107,12 @@ class GeneralProblem(Scene):
         
         # Key characteristic
         characteristic = VGroup(
-            Text(
+            cached_text(
                 "Goals are explicit",
                 font_size=26,
                 color=WHITE
             ),
-            Text(
+            cached_text(
                 "Correctness is measurable",
                 font_size=26,
                 color=WHITE
@@ -150,19 +153,19 @@ class GeneralProblem(Scene):
         
         # "However" message
         however_message = VGroup(
-            Text(
+            cached_text(
                 "However, ambiguous and culturally-situated tasks",
                 font_size=30,
                 weight=BOLD,
                 color=ORANGE
             ),
-            Text(
+            cached_text(
                 "remain largely unexplored",
                 font_size=30,
                 weight=BOLD,
                 color=ORANGE
             ),
-            Text(
+            cached_text(
                 "despite their centrality to human cognition",
                 font_size=30,
                 weight=BOLD,
@@ -177,7 +180,7 @@ class GeneralProblem(Scene):
         self.wait(0.5)
         
         # Examples of unexplored domains
-        unexplored_title = Text(
+        unexplored_title = cached_text(
             "Examples:",
             font_size=28,
             color=GREY_A
@@ -193,7 +196,7 @@ class GeneralProblem(Scene):
                 stroke_color=RED,
                 stroke_width=3
             ),
-            Text("Art", font_size=28, color=RED, weight=BOLD)
+            cached_text("Art", font_size=28, color=RED, weight=BOLD)
         ).arrange(DOWN, buff=0)
         art_box[1].move_to(art_box[0])
         
@@ -206,7 +209,7 @@ class GeneralProblem(Scene):
                 stroke_color=YELLOW,
                 stroke_width=3
             ),
-            Text("Creative Writing", font_size=22, color=YELLOW, weight=BOLD)
+            cached_text("Creative Writing", font_size=22, color=YELLOW, weight=BOLD)
         ).arrange(DOWN, buff=0)
         writing_box[1].move_to(writing_box[0])
         
@@ -219,7 +222,7 @@ class GeneralProblem(Scene):
                 stroke_color=TEAL,
                 stroke_width=3
             ),
-            Text("Music", font_size=28, color=TEAL, weight=BOLD)
+            cached_text("Music", font_size=28, color=TEAL, weight=BOLD)
         ).arrange(DOWN, buff=0)
         music_box[1].move_to(music_box[0])
         
@@ -242,17 +245,17 @@ class GeneralProblem(Scene):
         
         # Key characteristic of these domains
         cultural_characteristic = VGroup(
-            Text(
+            cached_text(
                 "No fixed endpoints",
                 font_size=26,
                 color=WHITE
             ),
-            Text(
+            cached_text(
                 "No universal criteria for success",
                 font_size=26,
                 color=WHITE
             ),
-            Text(
+            cached_text(
                 "Require contextual sensitivity and iterative exploration",
                 font_size=26,
                 color=WHITE
@@ -6,6 +6,8 @@ from manim import *
 import numpy as np
 from typing import List
 
+from scenes.texts import cached_text
+
 
 # ============================================================================
 # COLOR PALETTE (define once, use throughout)
@@ -43,7 +45,7 @@ def create_concept_node(text: str, color: str, position: np.ndarray,
         fill_opacity=0.2, 
         stroke_width=2
     )
-    label = Text(text, font_size=16, color=color)
+    label = cached_text(text, font_size=16, color=color)
     node = VGroup(circle, label).move_to(position)
     return node
 
@@ -5,13 +5,16 @@ Explains the Cultural Alien Sampler approach
 
 from manim import *
 
+from scenes.camera import CASScene
+from scenes.texts import cached_text
 
-class IntroducingCASSolution(Scene):
+
+class IntroducingCASSolution(CASScene):
     def construct(self):
         # First: The question slide
-        title = Text("Cultural Alien Sampler (CAS)", font_size=38, weight=BOLD).to_edge(UP, buff=0.3)
+        title = cached_text("Cultural Alien Sampler (CAS)", font_size=38, weight=BOLD).to_edge(UP, buff=0.3)
         
-        question = Text(
+        question = cached_text(
             "What if we explicitly navigate away from\ncultural patterns?",
             font_size=32,
             color=YELLOW,
@@ -27,7 +30,7 @@ class IntroducingCASSolution(Scene):
         self.play(FadeOut(question), run_time=0.8)
         
         # Second: WikiArt processing slide (simplified)
-        dataset_title = Text(
+        dataset_title = cached_text(
             "We decomposed each WikiArt artwork into 10 concepts using CLIP",
             font_size=26
         ).to_edge(UP, buff=1.3)
@@ -48,7 +51,7 @@ class IntroducingCASSolution(Scene):
                 stroke_color=WHITE,
                 stroke_width=2
             )
-            label = Text(f"artwork{i+1}", font_size=14, color=WHITE)
+            label = cached_text(f"artwork{i+1}", font_size=14, color=WHITE)
             item = VGroup(box, label).arrange(ORIGIN)
             artworks.add(item)
         
@@ -60,7 +63,7 @@ class IntroducingCASSolution(Scene):
         )
         
         # CLIP label at bottom
-        clip_label = Text("CLIP", font_size=28, weight=BOLD, color=PURPLE).to_edge(DOWN, buff=1.5)
+        clip_label = cached_text("CLIP", font_size=28, weight=BOLD, color=PURPLE).to_edge(DOWN, buff=1.5)
         
         self.play(Write(clip_label), run_time=0.6)
         
@@ -74,7 +77,7 @@ class IntroducingCASSolution(Scene):
                 stroke_color=TEAL,
                 stroke_width=2
             )
-            label = Text(f"concept list {i+1}", font_size=14, color=TEAL)
+            label = cached_text(f"concept list {i+1}", font_size=14, color=TEAL)
             item = VGroup(box, label).arrange(ORIGIN)
             concept_lists.add(item)
         
@@ -119,13 +122,13 @@ class IntroducingCASSolution(Scene):
         self.play(Create(divider), run_time=0.5)
         
         # LEFT SIDE: Concept Coherence Model
-        coherence_title = Text(
+        coherence_title = cached_text(
             "Concept Coherence Model",
             font_size=24,
             color=GREEN
         ).move_to(LEFT * 3.5 + UP * 2.5)
         
-        coherence_question = Text(
+        coherence_question = cached_text(
             '"Do these concepts fit together in an artwork?"',
             font_size=18,
             color=GREEN_A,
@@ -140,7 +143,7 @@ class IntroducingCASSolution(Scene):
             stroke_color=GREEN
         ).move_to(LEFT * 3.5 + UP * 1.3)
         
-        artwork_label = Text(
+        artwork_label = cached_text(
             "GPT2 trained on concepts\nused together in artworks",
             font_size=15,
             color=GREEN_A,
@@ -149,9 +152,9 @@ class IntroducingCASSolution(Scene):
         
         # Example concepts with high coherence
         coherent_concepts = VGroup(
-            Text("Anime", font_size=17, color=GREEN),
-            Text("Rabbit", font_size=17, color=GREEN),
-            Text("Renaissance", font_size=17, color=GREEN),
+            cached_text("Anime", font_size=17, color=GREEN),
+            cached_text("Rabbit", font_size=17, color=GREEN),
+            cached_text("Renaissance", font_size=17, color=GREEN),
         ).arrange(DOWN, buff=0.25).move_to(LEFT * 3.5 + DOWN * 0.6)
         
         coherence_arrows = VGroup(*[
@@ -166,7 +169,7 @@ class IntroducingCASSolution(Scene):
             for i in range(len(coherent_concepts)-1)
         ])
         
-        high_score = Text(
+        high_score = cached_text(
             "High Score ✓",
             font_size=20,
             color=GREEN,
@@ -174,13 +177,13 @@ class IntroducingCASSolution(Scene):
         ).next_to(coherent_concepts, DOWN, buff=0.45)
         
         # RIGHT SIDE: Cultural Context Model
-        context_title = Text(
+        context_title = cached_text(
             "Cultural Context Model",
             font_size=24,
             color=RED
         ).move_to(RIGHT * 3.5 + UP * 2.5)
         
-        context_question = Text(
+        context_question = cached_text(
             '"Is this combination typical?"',
             font_size=18,
             color=RED_A,
@@ -194,7 +197,7 @@ class IntroducingCASSolution(Scene):
               for i in range(-1, 2)]
         ).move_to(RIGHT * 3.5 + UP * 1.3)
         
-        artist_label = Text(
+        artist_label = cached_text(
             "GPT-2 trained on concepts extracted from\nartists' complete body of work",
             font_size=15,
             color=RED_A,
@@ -203,9 +206,9 @@ class IntroducingCASSolution(Scene):
         
         # Same concepts but checking cultural typicality
         typical_concepts = VGroup(
-            Text("Anime", font_size=17, color=RED),
-            Text("Rabbit", font_size=17, color=RED),
-            Text("Renaissance", font_size=17, color=RED),
+            cached_text("Anime", font_size=17, color=RED),
+            cached_text("Rabbit", font_size=17, color=RED),
+            cached_text("Renaissance", font_size=17, color=RED),
         ).arrange(DOWN, buff=0.25).move_to(RIGHT * 3.5 + DOWN * 0.6)
         
         # Show weak/broken connections (culturally rare)
@@ -228,7 +231,7 @@ class IntroducingCASSolution(Scene):
             )
         )
         
-        low_score = Text(
+        low_score = cached_text(
             "Low Score ✓",
             font_size=20,
             color=RED,
@@ -296,7 +299,7 @@ class IntroducingCASSolution(Scene):
         formula[1].set_color(GREEN)
         formula[3].set_color(RED)
         
-        target = Text(
+        target = cached_text(
             "Target: Coherent but Culturally Untypical Combinations",
             font_size=23,
             color=YELLOW,
@@ -5,11 +5,14 @@ Demonstrates the lack of originality in LLMs due to cultural bias
 
 from manim import *
 
+from scenes.camera import CASScene
+from scenes.texts import cached_text
 
-class LLMProblem(Scene):
+
+class LLMProblem(CASScene):
     def construct(self):
         # Title
-        title = Text("The Problem: LLMs Lack Originality", font_size=44, weight=BOLD).to_edge(UP)
+        title = cached_text("The Problem: LLMs Lack Originality", font_size=44, weight=BOLD).to_edge(UP)
         
         self.play(
             FadeIn(title),
@@ -28,12 +31,12 @@ class LLMProblem(Scene):
         ).shift(UP * 0.8)
         
         problem_text = VGroup(
-            Text(
+            cached_text(
                 "LLMs are not original when you run the system",
                 font_size=32,
                 color=WHITE
             ),
-            Text(
+            cached_text(
                 "for different inputs",
                 font_size=32,
                 color=WHITE
@@ -57,8 +60,8 @@ class LLMProblem(Scene):
         ).shift(DOWN * 2.0)
         
         explanation_text = VGroup(
-            Text("Training data reflects", font_size=32, color=WHITE),
-            Text("dominant cultural norms", font_size=32, color=ORANGE, weight=BOLD)
+            cached_text("Training data reflects", font_size=32, color=WHITE),
+            cached_text("dominant cultural norms", font_size=32, color=ORANGE, weight=BOLD)
         ).arrange(DOWN, buff=0.3).move_to(explanation_box)
         
         self.play(
@@ -78,7 +81,7 @@ class LLMProblem(Scene):
         )
         
         # SLIDE 3: Statistics
-        stats_title = Text(
+        stats_title = cached_text(
             "Evidence from GPT-4o",
             font_size=36,
             weight=BOLD,
@@ -97,9 +100,9 @@ class LLMProblem(Scene):
         ).shift(UP * 0.3)
         
         main_stat = VGroup(
-            Text("74.3%", font_size=72, color=RED, weight=BOLD),
-            Text("of concepts were repeated", font_size=28, color=WHITE),
-            Text("across different runs", font_size=28, color=WHITE)
+            cached_text("74.3%", font_size=72, color=RED, weight=BOLD),
+            cached_text("of concepts were repeated", font_size=28, color=WHITE),
+            cached_text("across different runs", font_size=28, color=WHITE)
         ).arrange(DOWN, buff=0.3).move_to(main_stat_box)
         
         self.play(
@@ -125,7 +128,7 @@ class LLMProblem(Scene):
         )
         
         # SLIDE 4: Common Concepts
-        concepts_subtitle = Text(
+        concepts_subtitle = cached_text(
             "Most Common Concepts",
             font_size=32,
             weight=BOLD,
@@ -148,13 +151,13 @@ class LLMProblem(Scene):
         ).shift(DOWN * 0.5)
         
         concepts_list = VGroup(
-            Text("• Quantum Physics", font_size=30, color=WHITE),
-            Text("• Bioluminescence", font_size=30, color=WHITE),
-            Text("• Cyberpunk", font_size=30, color=WHITE),
-            Text("• Mythology", font_size=30, color=WHITE),
-            Text("• Dreams", font_size=30, color=WHITE),
-            Text("• Algorithms", font_size=30, color=WHITE),
-            Text("• Technology", font_size=30, color=WHITE)
+            cached_text("• Quantum Physics", font_size=30, color=WHITE),
+            cached_text("• Bioluminescence", font_size=30, color=WHITE),
+            cached_text("• Cyberpunk", font_size=30, color=WHITE),
+            cached_text("• Mythology", font_size=30, color=WHITE),
+            cached_text("• Dreams", font_size=30, color=WHITE),
+            cached_text("• Algorithms", font_size=30, color=WHITE),
+            cached_text("• Technology", font_size=30, color=WHITE)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.35).move_to(concepts_box)
         
         self.play(
@@ -177,7 +180,7 @@ class LLMProblem(Scene):
         )
         
         # SLIDE 5: Transition to Solution
-        solution_title = Text(
+        solution_title = cached_text(
             "Our Solution",
             font_size=48,
             weight=BOLD,
@@ -200,9 +203,9 @@ class LLMProblem(Scene):
         ).shift(DOWN * 1)
         
         replacement_text = VGroup(
-            Text("Cultural Alien Sampler", font_size=40, color=GREEN, weight=BOLD),
-            Text("will replace GPT-4o", font_size=28, color=WHITE),
-            Text("in the Inspiration Module", font_size=28, color=WHITE)
+            cached_text("Cultural Alien Sampler", font_size=40, color=GREEN, weight=BOLD),
+            cached_text("will replace GPT-4o", font_size=28, color=WHITE),
+            cached_text("in the Inspiration Module", font_size=28, color=WHITE)
         ).arrange(DOWN, buff=0.4).move_to(replacement_box)
         
         self.play(
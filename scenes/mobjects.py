@@ -0,0 +1,415 @@
+"""
+Custom mobjects shared across scenes
+"""
+
+from manim import *
+import numpy as np
+from PIL import Image
+from typing import Optional
+
+from scenes.assets import MappedImageMobject, MediaFrames
+
+
+# ============================================================================
+# CROSSFADING IMAGES
+# ============================================================================
+class CrossfadeImage(MappedImageMobject):
+    """Image mobject that can show a blend of two RGBA arrays
+
+    A crossfade draws a single image per frame, blended with integer math
+    into buffers reused from frame to frame, instead of fading one image
+    mobject out while another fades in (two full images resampled by the
+    camera every frame).
+    """
+
+    def blend(self, start: np.ndarray, end: np.ndarray, alpha: float) -> "CrossfadeImage":
+        """Show (1 - alpha) * start + alpha * end; both arrays have the same shape"""
+        weight = int(round(np.clip(alpha, 0, 1) * 256))
+        if weight == 0:
+            self.pixel_array = start
+        elif weight == 256:
+            self.pixel_array = end
+        else:
+            if getattr(self, "_blend_buffers", None) is None \
+                    or self._blend_buffers[0].shape != start.shape:
+                self._blend_buffers = (
+                    np.empty(start.shape, dtype=np.uint16),
+                    np.empty(start.shape, dtype=np.uint16),
+                    np.empty(start.shape, dtype=np.uint8)
+                )
+            total, part, blended = self._blend_buffers
+            np.multiply(start, 256 - weight, out=total, dtype=np.uint16)
+            np.multiply(end, weight, out=part, dtype=np.uint16)
+            total += part
+            total >>= 8
+            np.copyto(blended, total, casting="unsafe")
+            self.pixel_array = blended
+        return self
+
+    def settled_pixels(self) -> np.ndarray:
+        """Current pixels, as an array that later blends will not overwrite"""
+        buffers = getattr(self, "_blend_buffers", None)
+        if buffers is not None and self.pixel_array is buffers[2]:
+            return self.pixel_array.copy()
+        return self.pixel_array
+
+
+def match_pixels(pixel_array: np.ndarray, shape) -> np.ndarray:
+    """
+    An RGBA array fitted to `shape` if it differs (so two images can be blended)
+
+    The image is scaled to fit and centered, keeping its aspect ratio; the
+    bars left over on two sides are transparent.
+    """
+    if pixel_array.shape == tuple(shape):
+        return pixel_array
+    height, width = shape[:2]
+    source_height, source_width = pixel_array.shape[:2]
+    scale = min(width / source_width, height / source_height)
+    fit_width = min(width, max(1, round(source_width * scale)))
+    fit_height = min(height, max(1, round(source_height * scale)))
+    image = Image.fromarray(np.asarray(pixel_array), "RGBA")
+    fitted = image.resize((fit_width, fit_height), Image.Resampling.LANCZOS)
+    letterboxed = np.zeros((height, width, 4), dtype=np.uint8)
+    left, top = (width - fit_width) // 2, (height - fit_height) // 2
+    letterboxed[top:top + fit_height, left:left + fit_width] = np.asarray(fitted)
+    return letterboxed
+
+
+class Crossfade(Animation):
+    """Crossfade a CrossfadeImage from its current pixels to new ones
+
+        self.play(Crossfade(img, prefetcher.get_pixels(gen_idx, 0)))
+
+    The image keeps its size: new pixels of another aspect ratio are
+    letterboxed into it rather than stretched (see match_pixels).
+    """
+
+    def __init__(self, mobject: CrossfadeImage, pixel_array: np.ndarray, **kwargs):
+        self.end_pixels = pixel_array
+        super().__init__(mobject, **kwargs)
+
+    def begin(self):
+        self.start_pixels = self.mobject.settled_pixels()
+        self.end_pixels = match_pixels(self.end_pixels, self.start_pixels.shape)
+        super().begin()
+
+    def create_starting_mobject(self) -> Mobject:
+        # The blend only needs the start pixels, not a copy of the mobject
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float):
+        self.mobject.blend(self.start_pixels, self.end_pixels, self.rate_func(alpha))
+
+
+# ============================================================================
+# STREAMED MEDIA
+# ============================================================================
+class MediaMobject(CrossfadeImage):
+    """Plays a GIF, video file or image folder, decoding only the frame shown
+
+    The frame follows the mobject's own clock, which runs while playback
+    is started and the scene plays animations or waits:
+
+        clip = MediaMobject("romanticism-landscape.gif", height=6.5)
+        self.add(clip)
+        clip.start_playback()
+        self.wait(5)  # Five seconds of the clip
+
+    Frames come from a MediaFrames source with a small LRU of decoded
+    frames, so memory stays flat however long the source is. With a
+    crossfade time, each frame blends in over the previous one.
+    """
+
+    def __init__(self, source: str, height: float,
+                 frame_rate: Optional[float] = None, loop: bool = True,
+                 crossfade: float = 0, cache_size: int = 8, **kwargs):
+        """
+        Args:
+            source: GIF file, video file or folder of images
+            height: Height in scene units
+            frame_rate: Source frames per second of scene time; defaults to
+                the source's own rate (1 frame per second for folders)
+            loop: Restart from the first frame after the last one,
+                otherwise hold the last frame
+            crossfade: Seconds each frame takes to blend in over the
+                previous one (0 cuts between frames)
+            cache_size: Number of decoded frames kept in memory
+        """
+        self.frames = MediaFrames(source, height, cache_size=cache_size)
+        self.frame_rate = frame_rate or self.frames.frame_rate or 1.0
+        self.loop = loop
+        self.crossfade = crossfade
+        self.time = 0.0
+        self.frame_index = 0
+        self.blend_alpha = 1.0
+        super().__init__(self.frames[0], **kwargs)
+        self.height = height
+
+    def _frame_index(self, position: int) -> int:
+        if self.loop:
+            return position % len(self.frames)
+        return min(position, len(self.frames) - 1)
+
+    def set_time(self, time: float) -> "MediaMobject":
+        """Show the frame at `time` seconds into the source"""
+        self.time = time
+        position = int(time * self.frame_rate)
+        index = self._frame_index(position)
+
+        alpha = 1.0
+        if self.crossfade > 0 and position > 0:
+            alpha = min(1.0, (time - position / self.frame_rate) / self.crossfade)
+        if index == self.frame_index and alpha == self.blend_alpha:
+            return self
+
+        end = self.frames[index]
+        if alpha < 1:
+            start = match_pixels(self.frames[self._frame_index(position - 1)], end.shape)
+            self.blend(start, end, alpha)
+        else:
+            self.pixel_array = end
+        self.frame_index = index
+        self.blend_alpha = alpha
+        return self
+
+    @staticmethod
+    def _advance(mobject: "MediaMobject", dt: float):
+        mobject.set_time(mobject.time + dt)
+
+    def start_playback(self) -> "MediaMobject":
+        """Advance through the source as scene time passes"""
+        self.add_updater(self._advance)
+        return self
+
+    def stop_playback(self) -> "MediaMobject":
+        """Hold the current frame"""
+        self.remove_updater(self._advance)
+        return self
+
+
+# ============================================================================
+# BATCHED MOBJECTS
+# ============================================================================
+def _is_color_list(colors) -> bool:
+    """Whether colors is a list of colors, rather than one color such as (1, 0, 0)"""
+    return isinstance(colors, (list, tuple)) and not all(
+        isinstance(c, (int, float, np.number)) for c in colors
+    )
+
+
+def _color_array(colors, count: int) -> np.ndarray:
+    """(count, 3) RGB array from one color, a list of colors or an RGB array"""
+    if isinstance(colors, np.ndarray) and colors.ndim == 2:
+        return np.asarray(colors[:, :3], dtype=float)
+    if _is_color_list(colors):
+        # Convert each distinct color once
+        palette = {}
+        for c in colors:
+            if str(c) not in palette:
+                palette[str(c)] = color_to_rgb(c)
+        rgbs = [palette[str(c)] for c in colors]
+        return np.array(rgbs, dtype=float).reshape(count, 3)
+    return np.tile(color_to_rgb(colors), (count, 1))
+
+
+class BatchedMobject(Mobject):
+    """Mobject made of many elements whose colors live in one (n, 4) rgbas array
+
+    CASCamera draws each kind of batched mobject in one pass, so scenes
+    using them derive from CASScene.
+    """
+
+    def init_rgbas(self, count: int, colors, opacities):
+        if _is_color_list(colors) and len(colors) != count:
+            # A short list of colors is cycled over the elements
+            colors = [colors[i % len(colors)] for i in range(count)]
+        self.rgbas = np.empty((count, 4))
+        self.rgbas[:, :3] = _color_array(colors, count)
+        self.rgbas[:, 3] = opacities
+
+    def set_color(self, color=WHITE, family: bool = True) -> "BatchedMobject":
+        self.rgbas[:, :3] = _color_array(color, len(self.rgbas))
+        self.color = color
+        return self
+
+    def set_opacity(self, opacity: float, family: bool = True) -> "BatchedMobject":
+        self.rgbas[:, 3] = opacity
+        return self
+
+    def fade(self, darkness: float = 0.5, family: bool = True) -> "BatchedMobject":
+        self.rgbas[:, 3] *= 1 - darkness
+        return super().fade(darkness, family)
+
+    def get_opacities(self) -> np.ndarray:
+        return self.rgbas[:, 3]
+
+
+# ============================================================================
+# POINT CLOUDS
+# ============================================================================
+class PointCloud(BatchedMobject):
+    """Many round points stored as arrays: positions, colors, radii, opacities
+
+    Unlike a VGroup of Dots, setup, transforms and interpolation work on
+    whole arrays, and CASCamera draws every point of the cloud in one
+    vectorized pass, so the cost grows with the number of points rather
+    than the number of Python objects.
+
+        cloud = PointCloud(positions, colors=[BLUE, GREEN], radii=0.015)
+        self.play(FadeIn(cloud))
+        self.play(MovePoints(cloud, new_positions), run_time=2)
+    """
+
+    def __init__(self, points: np.ndarray, colors=WHITE, radii=0.05,
+                 opacities=1.0, **kwargs):
+        """
+        Args:
+            points: (n, 3) positions
+            colors: One color, n colors, or an (n, 3) RGB array
+            radii: Radius of every point, or (n,) radii, in scene units
+            opacities: Opacity of every point, or (n,) opacities
+        """
+        super().__init__(**kwargs)
+        self.points = np.array(points, dtype=float).reshape(-1, 3)
+        count = len(self.points)
+        self.init_rgbas(count, colors, opacities)
+        self.radii = np.broadcast_to(np.asarray(radii, dtype=float), (count,)).copy()
+
+    def get_array_attrs(self):
+        return super().get_array_attrs() + ["rgbas", "radii"]
+
+    def set_points(self, points: np.ndarray) -> "PointCloud":
+        self.points = np.array(points, dtype=float).reshape(-1, 3)
+        return self
+
+    def interpolate_color(self, mobject1: "PointCloud", mobject2: "PointCloud",
+                          alpha: float):
+        self.rgbas = interpolate(mobject1.rgbas, mobject2.rgbas, alpha)
+        self.radii = interpolate(mobject1.radii, mobject2.radii, alpha)
+
+    def align_points_with_larger(self, larger_mobject: Mobject):
+        count = len(larger_mobject.points)
+        for attr in self.get_array_attrs():
+            setattr(self, attr, stretch_array_to_length(getattr(self, attr), count))
+
+
+class MovePoints(Animation):
+    """Move every point of a PointCloud to new positions in one array update
+
+    A single animation interpolates the whole position array each frame,
+    instead of one .animate.move_to() animation (with its own copy of the
+    mobject) per point.
+    """
+
+    def __init__(self, cloud: PointCloud, target_points: np.ndarray, **kwargs):
+        self.target_points = np.array(target_points, dtype=float).reshape(-1, 3)
+        super().__init__(cloud, **kwargs)
+
+    def begin(self):
+        self.start_points = self.mobject.points.copy()
+        super().begin()
+
+    def create_starting_mobject(self) -> Mobject:
+        # Only the start positions are needed, not a copy of the cloud
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float):
+        self.mobject.points = interpolate(
+            self.start_points, self.target_points, self.rate_func(alpha)
+        )
+
+
+# ============================================================================
+# LINE COLLECTIONS
+# ============================================================================
+class LineCollection(BatchedMobject):
+    """Many straight segments in one vertex array, each with its own style
+
+    Segment i runs from points[2 * i] to points[2 * i + 1]; colors, widths
+    (stroke_width units, as for Line), opacities and the drawn fraction of
+    each segment are arrays. CASCamera strokes all segments sharing a style
+    as one cairo path, so the cost grows with the number of segments rather
+    than the number of Line mobjects.
+
+        web = LineCollection(starts, ends, colors=BLUE, widths=0.8, drawn=0)
+        self.play(DrawSegments(web, lag_ratio=0.002), run_time=2.5)
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, colors=WHITE,
+                 widths=DEFAULT_STROKE_WIDTH, opacities=1.0, drawn=1.0, **kwargs):
+        """
+        Args:
+            starts: (n, 3) segment start points
+            ends: (n, 3) segment end points
+            colors: One color, n colors, or an (n, 3) RGB array
+            widths: Stroke width of every segment, or (n,) widths
+            opacities: Opacity of every segment, or (n,) opacities
+            drawn: Fraction of each segment drawn from its start (0 hides
+                it until a DrawSegments animation draws it on)
+        """
+        super().__init__(**kwargs)
+        starts = np.array(starts, dtype=float).reshape(-1, 3)
+        ends = np.array(ends, dtype=float).reshape(-1, 3)
+        count = len(starts)
+        self.points = np.empty((2 * count, 3))
+        self.points[0::2] = starts
+        self.points[1::2] = ends
+        self.init_rgbas(count, colors, opacities)
+        self.widths = np.broadcast_to(np.asarray(widths, dtype=float), (count,)).copy()
+        self.drawn = np.broadcast_to(np.asarray(drawn, dtype=float), (count,)).copy()
+
+    def __len__(self) -> int:
+        return len(self.rgbas)
+
+    def visible_segments(self):
+        """(starts, ends, index) of the drawn part of every segment that shows"""
+        index = np.nonzero((self.drawn > 0) & (self.rgbas[:, 3] > 0) & (self.widths > 0))[0]
+        starts = self.points[0::2][index]
+        ends = self.points[1::2][index]
+        ends = starts + (ends - starts) * self.drawn[index, None]
+        return starts, ends, index
+
+    def interpolate_color(self, mobject1: "LineCollection", mobject2: "LineCollection",
+                          alpha: float):
+        self.rgbas = interpolate(mobject1.rgbas, mobject2.rgbas, alpha)
+        self.widths = interpolate(mobject1.widths, mobject2.widths, alpha)
+        self.drawn = interpolate(mobject1.drawn, mobject2.drawn, alpha)
+
+    def align_points_with_larger(self, larger_mobject: Mobject):
+        # Only called by Mobject.align_points when the segment counts differ
+        raise ValueError("Line collections can only be transformed into same-size ones")
+
+
+class DrawSegments(Animation):
+    """Draw segments of a LineCollection on from their starts, like Create
+
+    Segment k of the animated selection starts after k * lag_ratio of one
+    segment's duration, as Create does for the submobjects of a group;
+    the drawn fraction of every segment is computed in one array operation.
+    The collection is added to the scene if it is not there yet.
+
+    Args:
+        lines: The collection
+        segments: Indices or slice of the segments to draw (default: all)
+        lag_ratio: Stagger between consecutive segments
+    """
+
+    def __init__(self, lines: LineCollection, segments=None, lag_ratio: float = 1.0,
+                 introducer: bool = True, **kwargs):
+        self.segments = np.arange(len(lines))[segments if segments is not None else slice(None)]
+        super().__init__(lines, lag_ratio=lag_ratio, introducer=introducer, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # Only the drawn fractions change
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float):
+        count = len(self.segments)
+        full_length = (count - 1) * self.lag_ratio + 1
+        lower = np.arange(count) * self.lag_ratio
+        sub_alphas = np.clip(alpha * full_length - lower, 0, 1)
+        # Rate functions take scalars; only segments being drawn need one
+        partial = (sub_alphas > 0) & (sub_alphas < 1)
+        sub_alphas[partial] = [self.rate_func(sub_alpha) for sub_alpha in sub_alphas[partial]]
+        self.mobject.drawn[self.segments] = sub_alphas
@@ -5,11 +5,14 @@ Shows the autonomous agent comprised of main components
 
 from manim import *
 
+from scenes.camera import CASScene
+from scenes.texts import cached_text
 
-class OpenEndedAgent(Scene):
+
+class OpenEndedAgent(CASScene):
     def construct(self):
         # Title
-        title = Text("We built a Open-Ended System for Art", font_size=40, weight=BOLD).to_edge(UP)
+        title = cached_text("We built a Open-Ended System for Art", font_size=40, weight=BOLD).to_edge(UP)
         
         self.play(Write(title), run_time=1)
         self.wait(0.5)
@@ -31,7 +34,7 @@ class OpenEndedAgent(Scene):
                 stroke_color=BLUE,
                 stroke_width=3
             ),
-            Text("Concept\nPool", font_size=22, color=BLUE, weight=BOLD)
+            cached_text("Concept\nPool", font_size=22, color=BLUE, weight=BOLD)
         ).move_to(LEFT * 4.5 + UP * 0.5)
         
         # Inspiration Module
@@ -45,7 +48,7 @@ class OpenEndedAgent(Scene):
                 stroke_color=PURPLE,
                 stroke_width=3
             ),
-            Text("Inspiration\nModule\n(GPT-4o)", font_size=22, color=PURPLE, weight=BOLD)
+            cached_text("Inspiration\nModule\n(GPT-4o)", font_size=22, color=PURPLE, weight=BOLD)
         ).move_to(LEFT * 1.8 + UP * 0.5)
         
         # Prompt Compositor
@@ -59,7 +62,7 @@ class OpenEndedAgent(Scene):
                 stroke_color=GREEN,
                 stroke_width=3
             ),
-            Text("Prompt\nCompositor\n(LLM)", font_size=22, color=GREEN, weight=BOLD)
+            cached_text("Prompt\nCompositor\n(LLM)", font_size=22, color=GREEN, weight=BOLD)
         ).move_to(RIGHT * 1 + UP * 0.5)
         
         # Image Generator
@@ -73,7 +76,7 @@ class OpenEndedAgent(Scene):
                 stroke_color=ORANGE,
                 stroke_width=3
             ),
-            Text("Image\nGenerator", font_size=22, color=ORANGE, weight=BOLD)
+            cached_text("Image\nGenerator", font_size=22, color=ORANGE, weight=BOLD)
         ).move_to(RIGHT * 3.8 + UP * 0.5)
         
         # Novelty Score (feedback component)
@@ -87,7 +90,7 @@ class OpenEndedAgent(Scene):
                 stroke_color=YELLOW,
                 stroke_width=3
             ),
-            Text("Novelty Score", font_size=22, color=YELLOW, weight=BOLD)
+            cached_text("Novelty Score", font_size=22, color=YELLOW, weight=BOLD)
         ).move_to(DOWN * 1.8)
         
         # Animate components appearing in sequence
@@ -163,7 +166,7 @@ class OpenEndedAgent(Scene):
             angle=-TAU/4
         )
         
-        feedback_label = Text(
+        feedback_label = cached_text(
             "iterative\nfeedback",
             font_size=16,
             color=YELLOW,
@@ -174,7 +177,7 @@ class OpenEndedAgent(Scene):
         self.play(FadeIn(feedback_label), run_time=0.5)
         
         # Summary description
-        description = Text(
+        description = cached_text(
             "Novelty drives the exploration of conceptual combinations",
             font_size=26,
             color=WHITE
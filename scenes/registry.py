@@ -0,0 +1,137 @@
+"""
+Scene registry: finds the scene classes of this package by parsing the
+module sources, so listing scenes never imports manim, PIL or the scenes
+themselves. A scene module is only imported when one of its scenes is loaded.
+"""
+
+import ast
+import importlib
+import os
+from functools import lru_cache
+
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Playback order of the video (render_scenes.py numbers scenes in this order).
+# Scenes found in the package but not listed here are still available by name.
+SCENE_ORDER = [
+    "GeneralProblem",
+    "CreativeParadox",
+    "ConceptReframing",
+    "LLMProblem",
+    "OpenEndedAgent",
+    "IntroducingCASSolution",
+    "EvolutionaryTree",
+    "CAMShowcase",
+    "ExperimentalResults"
+]
+
+# manim base classes that make a class a scene
+MANIM_SCENE_BASES = {
+    "Scene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "ThreeDScene",
+    "SpecialThreeDScene",
+    "VectorScene",
+    "LinearTransformationScene"
+}
+
+
+def _base_names(class_node):
+    names = []
+    for base in class_node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+@lru_cache(maxsize=None)
+def _parse_package():
+    """Module docstrings and class definitions of every module in the package"""
+    modules = {}
+    for file_name in sorted(os.listdir(PACKAGE_DIR)):
+        module_name, ext = os.path.splitext(file_name)
+        if ext != ".py" or module_name in ("__init__", "registry"):
+            continue
+        with open(os.path.join(PACKAGE_DIR, file_name), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), file_name)
+        modules[module_name] = (
+            ast.get_docstring(tree),
+            [node for node in tree.body if isinstance(node, ast.ClassDef)]
+        )
+    return modules
+
+
+@lru_cache(maxsize=None)
+def discover_scenes():
+    """
+    Find every renderable scene class in the package
+
+    A class is a scene if it derives from a manim scene class, directly or
+    through another class of the package, and it is renderable if it (or a
+    package base) defines construct().
+
+    Returns:
+        {scene class name: module name}, in SCENE_ORDER first, then by name
+    """
+    classes = {
+        node.name: (module_name, node)
+        for module_name, (_, nodes) in _parse_package().items()
+        for node in nodes
+    }
+
+    # Propagate "is a scene" and "has construct" through package base classes
+    scenes = {}
+    changed = True
+    while changed:
+        changed = False
+        for name, (module_name, node) in classes.items():
+            if name in scenes:
+                continue
+            bases = _base_names(node)
+            if not any(base in MANIM_SCENE_BASES or base in scenes for base in bases):
+                continue
+            defines_construct = any(
+                isinstance(item, ast.FunctionDef) and item.name == "construct"
+                for item in node.body
+            )
+            scenes[name] = defines_construct or any(scenes.get(base) for base in bases)
+            changed = True
+
+    found = {name: classes[name][0] for name, concrete in scenes.items() if concrete}
+    ordered = [name for name in SCENE_ORDER if name in found]
+    ordered += sorted(name for name in found if name not in SCENE_ORDER)
+    return {name: found[name] for name in ordered}
+
+
+def video_scenes():
+    """Scenes of the video, in playback order"""
+    return [name for name in SCENE_ORDER if name in discover_scenes()]
+
+
+def scene_module(name):
+    """Name of the module (inside the package) that defines a scene"""
+    try:
+        return discover_scenes()[name]
+    except KeyError:
+        raise KeyError(f"Unknown scene '{name}'") from None
+
+
+def scene_description(name):
+    """One-line description: the class docstring, else the module docstring"""
+    module_doc, nodes = _parse_package()[scene_module(name)]
+    for node in nodes:
+        if node.name == name and ast.get_docstring(node):
+            return ast.get_docstring(node).splitlines()[0]
+    lines = [line for line in (module_doc or "").splitlines() if line.strip()]
+    # Module docstrings read "SCENE N: Title" followed by a description line
+    return lines[1] if len(lines) > 1 else (lines[0] if lines else "")
+
+
+def load_scene(name):
+    """Import a scene's module and return the scene class"""
+    module = importlib.import_module(f"{__package__}.{scene_module(name)}")
+    return getattr(module, name)
@@ -0,0 +1,97 @@
+"""
+Text and MarkupText with their geometry cached on disk
+
+manim builds every Text by rendering it with Pango to an SVG file, parsing
+the SVG and constructing one VMobject per glyph. cached_text() and
+cached_markup_text() take the same arguments as manim's classes and return
+the same mobjects, but the finished mobject (its point arrays and style) is
+stored in media/cache/text/, keyed by the text and every argument. Later
+calls, later renders and parallel render processes load it from there
+without calling Pango or the SVG parser.
+
+Scene modules use them in place of manim's Text and MarkupText:
+
+    from manim import *
+    from scenes.texts import cached_text
+
+    title = cached_text("Cultural Alien Sampler", font_size=48)
+
+The cache does not see installed fonts: after changing fonts, delete
+media/cache/text/.
+"""
+
+import hashlib
+import os
+import pickle
+
+import manim
+
+from scenes.assets import CACHE_DIR, atomic_write
+
+
+TEXT_CACHE_DIR = os.path.join(CACHE_DIR, "text")
+
+# Mobjects built or loaded in this process, by cache key
+_texts = {}
+
+
+def _text_key(cls: type, text: str, args: tuple, kwargs: dict) -> str:
+    # Colors and other argument objects have stable reprs, e.g. ManimColor('#58C4DD')
+    description = repr((
+        manim.__version__,
+        cls.__name__,
+        text,
+        args,
+        sorted(kwargs.items())
+    ))
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+def _load_or_build(cls: type, key: str, text: str, args: tuple, kwargs: dict) -> manim.Mobject:
+    path = os.path.join(TEXT_CACHE_DIR, f"{key}.pkl")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass  # Not cached yet, or written by an incompatible version
+
+    mobject = cls(text, *args, **kwargs)
+
+    def write(tmp_path):
+        with open(tmp_path, "wb") as f:
+            pickle.dump(mobject, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    try:
+        # Concurrent renders never load a partial file
+        atomic_write(path, write)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        pass  # An argument that cannot be stored (such as a function): use the mobject uncached
+    return mobject
+
+
+def cached_mobject(cls: type, text: str, *args, **kwargs) -> manim.Mobject:
+    """
+    A new `cls(text, *args, **kwargs)`, built from the text cache when possible
+
+    Args:
+        cls: manim.Text, manim.MarkupText or a subclass
+        text: The text
+        *args, **kwargs: Any other arguments of cls, all part of the cache key
+
+    Returns:
+        A copy of the cached mobject, free to modify
+    """
+    key = _text_key(cls, text, args, kwargs)
+    if key not in _texts:
+        _texts[key] = _load_or_build(cls, key, text, args, kwargs)
+    return _texts[key].copy()
+
+
+def cached_text(text: str, *args, **kwargs) -> manim.Text:
+    """manim.Text, with its geometry cached across renders and processes"""
+    return cached_mobject(manim.Text, text, *args, **kwargs)
+
+
+def cached_markup_text(text: str, *args, **kwargs) -> manim.MarkupText:
+    """manim.MarkupText, with its geometry cached across renders and processes"""
+    return cached_mobject(manim.MarkupText, text, *args, **kwargs)
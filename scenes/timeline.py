@@ -0,0 +1,72 @@
+"""
+Timeline playback: one play whose frames are computed from the scene clock
+
+A scene phase made of many short, regular animations (fade this node in,
+pulse it, move to the next) costs one play per animation, each with its own
+partial movie file. A Timeline plays the whole phase at once: every frame,
+its tracks receive the time since the start of the play and set the state
+of their mobjects directly, typically with curves over arrays of start
+times from progress().
+"""
+
+from typing import Callable
+
+from manim import *
+import numpy as np
+
+
+def progress(time: float, start, duration: float, rate_func: Callable = smooth) -> np.ndarray:
+    """
+    rate_func of the elapsed fraction of each interval [start, start + duration]
+
+    Args:
+        time: Current time
+        start: Start time of each interval (a scalar or an array)
+        duration: Length of the intervals
+        rate_func: manim rate function applied to the clamped fraction, so
+            the result matches an animation with that rate_func
+
+    Returns:
+        Array shaped like start: rate_func(0) before an interval, rate_func(1) after it
+    """
+    alpha = np.clip((time - np.asarray(start, dtype=float)) / duration, 0, 1)
+    # manim's rate functions take one float, so only intervals in progress call
+    # rate_func per element; the ones not started or finished share two calls
+    result = np.where(alpha < 1, float(rate_func(0.0)), float(rate_func(1.0)))
+    running = (alpha > 0) & (alpha < 1)
+    result[running] = [rate_func(a) for a in alpha[running]]
+    return result
+
+
+class Timeline(Animation):
+    """Plays `run_time` seconds of scene time in which tracks set every state
+
+        def track(time):
+            dots.set_opacity(progress(time, starts, 0.5))
+            clip.set_time(time)
+
+        self.play(Timeline(Group(dots, clip), track, run_time=30))
+
+    The mobject should already be in the scene and hold everything the
+    tracks change, so the scene redraws it on each frame. Each track is a
+    function of the time in seconds since the start of the play; easing
+    belongs in the tracks, so a Timeline takes no rate_func.
+    """
+
+    def __init__(self, mobject: Mobject, *tracks: Callable[[float], None], **kwargs):
+        if "rate_func" in kwargs:
+            raise TypeError(
+                "Timeline plays scene time linearly; "
+                "apply rate functions inside the tracks (see progress())"
+            )
+        self.tracks = tracks
+        super().__init__(mobject, rate_func=linear, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # The tracks compute states from time alone, so no starting copy is needed
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float):
+        time = alpha * self.run_time
+        for track in self.tracks:
+            track(time)
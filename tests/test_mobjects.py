@@ -0,0 +1,32 @@
+"""
+Tests of the custom mobjects in scenes/mobjects.py
+"""
+
+import pytest
+
+pytest.importorskip("manim")
+np = pytest.importorskip("numpy")
+
+from manim import Transform
+
+from scenes.mobjects import LineCollection
+
+
+def _lines(count: int) -> LineCollection:
+    starts = np.zeros((count, 3))
+    ends = np.column_stack([np.arange(1, count + 1), np.zeros(count), np.zeros(count)])
+    return LineCollection(starts, ends, widths=np.arange(1, count + 1))
+
+
+def test_transform_between_same_size_line_collections():
+    lines, target = _lines(3), _lines(3).shift([0, 1, 0])
+    animation = Transform(lines, target)
+    animation.begin()
+    animation.interpolate(1)
+    assert np.allclose(lines.points, target.points)
+    assert np.allclose(lines.widths, target.widths)
+
+
+def test_transform_between_line_collections_of_different_sizes_is_rejected():
+    with pytest.raises(ValueError, match="same-size"):
+        Transform(_lines(3), _lines(5)).begin()